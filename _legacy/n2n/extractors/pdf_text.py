@@ -1,36 +1,92 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
-import pdfplumber
+import fitz
 
 from n2n.models import ExtractionResult
 
 
-KEYWORDS = ["sort code", "account number", "iban", "statement", "account"]
+# "account" is a prefix of "account number", so the earlier entries only
+# matter for readability; any() stops at the first hit.
+KEYWORDS = ("sort code", "account number", "iban", "statement", "account")
+
+# Below this page count the process-pool startup costs more than it saves.
+PARALLEL_PAGE_THRESHOLD = 32
+# Pages handled per worker task; blocks amortize the per-task PDF open.
+PAGE_BLOCK_SIZE = 10
 
 
 def _estimate_quality(pages: List[str]) -> float:
-    joined = "\n".join(pages)
-    length = len(joined.strip())
-    if length == 0:
+    # Page-by-page so the heuristic never materializes the joined document;
+    # once the length score saturates and a keyword has hit, nothing later
+    # can change the result.
+    total_length = 0
+    keyword_found = False
+    for page in pages:
+        total_length += len(page.strip())
+        if not keyword_found:
+            page_lower = page.lower()
+            keyword_found = any(keyword in page_lower for keyword in KEYWORDS)
+        if total_length >= 2000 and keyword_found:
+            break
+
+    if total_length == 0:
         return 0.0
 
     # length-based score: 0.0 -> 0 chars, 1.0 -> >= 2000 chars
-    length_score = min(1.0, length / 2000.0)
-
-    lower_text = joined.lower()
-    keyword_boost = 0.1 if any(keyword in lower_text for keyword in KEYWORDS) else 0.0
+    length_score = min(1.0, total_length / 2000.0)
+    keyword_boost = 0.1 if keyword_found else 0.0
 
     return float(min(1.0, length_score + keyword_boost))
 
 
+def _get_max_workers(n_tasks: int) -> int:
+    return max(1, min(os.cpu_count() or 1, n_tasks))
+
+
+def _page_text(doc: "fitz.Document", index: int) -> str:
+    # A page without font resources carries no text objects, which is the
+    # common case for scanned statements; skip the text walk outright
+    # instead of decompressing image streams to find nothing.
+    if not doc.get_page_fonts(index):
+        return ""
+    return doc[index].get_text("text") or ""
+
+
+def _extract_page_block(args: Tuple[str, int, int]) -> List[str]:
+    path_str, start, stop = args
+    doc = fitz.open(path_str)
+    try:
+        return [_page_text(doc, index) for index in range(start, stop)]
+    finally:
+        doc.close()
+
+
 def extract_text_with_quality(file_path: Path) -> ExtractionResult:
-    pages: List[str] = []
+    # PyMuPDF keeps the per-page text walk in MuPDF's C core, which is an
+    # order of magnitude faster than the pdfplumber/pdfminer stack for
+    # plain text extraction.
+    doc = fitz.open(str(file_path))
+    try:
+        n_pages = len(doc)
+        if n_pages < PARALLEL_PAGE_THRESHOLD:
+            pages: List[str] = [_page_text(doc, index) for index in range(n_pages)]
+        else:
+            pages = []
+    finally:
+        doc.close()
 
-    with pdfplumber.open(str(file_path)) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text() or ""
-            pages.append(text)
+    if n_pages >= PARALLEL_PAGE_THRESHOLD:
+        # Large statements are CPU-bound on parsing; fan page blocks out to
+        # worker processes and reassemble in submission order.
+        blocks = [
+            (str(file_path), start, min(start + PAGE_BLOCK_SIZE, n_pages))
+            for start in range(0, n_pages, PAGE_BLOCK_SIZE)
+        ]
+        with ProcessPoolExecutor(max_workers=_get_max_workers(len(blocks))) as pool:
+            pages = [text for block in pool.map(_extract_page_block, blocks) for text in block]
 
     quality_score = _estimate_quality(pages)
 
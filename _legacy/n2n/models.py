@@ -12,7 +12,7 @@ class PiiCategory(str, Enum):
     GOV_IDENTIFIERS = "gov_identifiers"
 
 
-@dataclass
+@dataclass(slots=True)
 class TextSpan:
     page_index: int
     text: str
@@ -21,7 +21,9 @@ class TextSpan:
     ocr_confidence: Optional[float] = None
 
 
-@dataclass
+# Spans and detections are allocated once per match, so these two carry
+# __slots__; the other models are per-file and not worth the restriction.
+@dataclass(slots=True)
 class DetectionResult:
     field_id: str
     category: PiiCategory
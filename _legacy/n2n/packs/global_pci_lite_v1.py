@@ -169,7 +169,7 @@ def _span_stats(spans: List[TextSpan]) -> tuple[int, int]:
 
 
 def run_pci_lite_pack(input_path: Path, config_dir: Path) -> DecisionReport:
-    defaults, _ = _load_configs(config_dir)
+    config = _load_configs(config_dir)
     artifacts: Dict[str, Optional[str]] = {
         "input_pdf": str(input_path),
         "highlight_pdf": None,
@@ -186,7 +186,7 @@ def run_pci_lite_pack(input_path: Path, config_dir: Path) -> DecisionReport:
         LOGGER.exception("Highlight generation failed: %s", exc)
         artifacts["highlight_pdf"] = None
 
-    extraction, extraction_reason = _extract_with_mode(input_path, defaults)
+    extraction, extraction_reason = _extract_with_mode(input_path, config)
     if extraction is None or extraction_reason:
         return _finalize(
             decision="REJECTED",
@@ -235,7 +235,7 @@ def run_pci_lite_pack(input_path: Path, config_dir: Path) -> DecisionReport:
 
         artifacts["redacted_pdf"] = str(redaction_outcome.output_path)
 
-        re_extraction, _ = _extract_with_mode(Path(redaction_outcome.output_path), defaults)
+        re_extraction, _ = _extract_with_mode(Path(redaction_outcome.output_path), config)
         if re_extraction is None:
             return _finalize(
                 decision="REVIEW",
@@ -129,7 +129,7 @@ def _run_profile(spans, profile_id: str) -> List[DetectionResult]:
 
 
 def run_uk_bank_statement_pack(input_path: Path, config_dir: Path) -> DecisionReport:
-    defaults, _ = _load_configs(config_dir)
+    config = _load_configs(config_dir)
     artifacts: Dict[str, Optional[str]] = {
         "input_pdf": str(input_path),
         "highlight_pdf": None,
@@ -139,7 +139,7 @@ def run_uk_bank_statement_pack(input_path: Path, config_dir: Path) -> DecisionRe
 
     artifacts["highlight_pdf"] = _generate_highlight_artifact(input_path, config_dir)
 
-    extraction, extraction_reason = _extract_with_mode(input_path, defaults)
+    extraction, extraction_reason = _extract_with_mode(input_path, config)
     if extraction is None or extraction_reason:
         return _finalize(
             decision="REJECTED",
@@ -1,13 +1,19 @@
+import functools
 import logging
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 from n2n import DEFAULT_QUALITY_THRESHOLD
 from n2n.detectors.bank_statement_uk import detect_pii_uk_bank_statement
 from n2n.extractors.pdf_ocr import extract_text_with_quality_ocr
 from n2n.extractors.pdf_text import extract_text_with_quality
 from n2n.models import DetectionResult, ExtractionResult, PiiCategory, RedactionOutcome
+from n2n.primitives._pdfcache import shared_pdfs
 from n2n.renderers.pdf_highlight import highlight_pdf
 from n2n.renderers.pdf_mupdf import apply_redactions
 from n2n.utils.config_loader import load_global_config, load_profile_config
@@ -24,32 +30,51 @@ CURRENCY_RE = re.compile(
 )
 
 
-def _load_configs(config_dir: Path) -> Tuple[dict, dict]:
+@dataclass(frozen=True, slots=True)
+class PipelineConfig:
+    """Parsed configuration with the per-run values extracted up front."""
+
+    defaults: dict
+    profile: dict
+    threshold: float
+    suffix: str
+    extractor_mode: str
+
+
+@functools.lru_cache(maxsize=16)
+def _load_configs_cached(config_dir_str: str) -> PipelineConfig:
+    config_dir = Path(config_dir_str)
     defaults = load_global_config(config_dir)
     profile = load_profile_config(config_dir, defaults["country_pack"], defaults["profile"])
-    return defaults, profile
 
-
-def _get_threshold(defaults: dict) -> float:
     threshold = defaults.get("quality_threshold", DEFAULT_QUALITY_THRESHOLD)
     try:
-        return float(threshold)
+        threshold = float(threshold)
     except (TypeError, ValueError):
-        return DEFAULT_QUALITY_THRESHOLD
+        threshold = DEFAULT_QUALITY_THRESHOLD
+    suffix = defaults.get("output", {}).get("suffix")
+
+    return PipelineConfig(
+        defaults=defaults,
+        profile=profile,
+        threshold=threshold,
+        suffix=str(suffix) if suffix else "_redacted",
+        extractor_mode=str(defaults.get("extractor_mode", "auto")).lower(),
+    )
 
 
-def _get_output_suffix(defaults: dict) -> str:
-    output = defaults.get("output", {})
-    suffix = output.get("suffix")
-    return str(suffix) if suffix else "_redacted"
+def _load_configs(config_dir: Path) -> PipelineConfig:
+    # Batch runs call the pipeline once per file; cache on the resolved
+    # directory so the config files are read and parsed only once.
+    return _load_configs_cached(str(Path(config_dir).resolve()))
 
 
 def _extract_with_mode(
     input_path: Path,
-    defaults: dict,
+    config: PipelineConfig,
 ) -> Tuple[ExtractionResult | None, str | None]:
-    mode = str(defaults.get("extractor_mode", "auto")).lower()
-    threshold = _get_threshold(defaults)
+    mode = config.extractor_mode
+    threshold = config.threshold
 
     def _is_valid(result: ExtractionResult) -> bool:
         return result.quality_score >= threshold
@@ -80,28 +105,28 @@ def _extract_with_mode(
 
 def _prepare_detections(
     input_path: Path, config_dir: Path
-) -> Tuple[dict, List[DetectionResult], str | None]:
-    defaults, profile = _load_configs(config_dir)
+) -> Tuple[PipelineConfig, List[DetectionResult], str | None]:
+    config = _load_configs(config_dir)
 
-    extraction, extraction_reason = _extract_with_mode(input_path, defaults)
+    extraction, extraction_reason = _extract_with_mode(input_path, config)
 
     if extraction is None:
-        return defaults, [], extraction_reason or "quality_too_low"
+        return config, [], extraction_reason or "quality_too_low"
 
-    detections = detect_pii_uk_bank_statement(extraction, profile)
+    detections = detect_pii_uk_bank_statement(extraction, config.profile)
     strict_detections = [d for d in detections if d.confidence >= 1.0 and d.severity == "hit"]
     strict_detections, dropped = _precision_filter(strict_detections)
     if dropped:
         LOGGER.info("Precision filter dropped %s detections", dropped)
 
     if not strict_detections:
-        return defaults, [], "no_pii_found"
+        return config, [], "no_pii_found"
 
-    return defaults, strict_detections, None
+    return config, strict_detections, None
 
 
 def run_pipeline(input_path: Path, config_dir: Path) -> RedactionOutcome:
-    defaults, strict_detections, reason = _prepare_detections(input_path, config_dir)
+    config, strict_detections, reason = _prepare_detections(input_path, config_dir)
 
     if reason:
         return RedactionOutcome(
@@ -111,8 +136,7 @@ def run_pipeline(input_path: Path, config_dir: Path) -> RedactionOutcome:
             reason=reason,
         )
 
-    suffix = _get_output_suffix(defaults)
-    output_path = input_path.with_name(f"{input_path.stem}{suffix}.pdf")
+    output_path = input_path.with_name(f"{input_path.stem}{config.suffix}.pdf")
 
     apply_redactions(
         input_pdf=input_path,
@@ -128,8 +152,30 @@ def run_pipeline(input_path: Path, config_dir: Path) -> RedactionOutcome:
     )
 
 
+def run_pipeline_batch(
+    paths: Iterable[Path], config_dir: Path, workers: int | None = None
+) -> List[RedactionOutcome]:
+    """Redact a batch of PDFs, fanning out across worker processes.
+
+    Files are independent, so the batch is embarrassingly parallel; each
+    worker parses the config at most once thanks to the per-process
+    _load_configs cache. Outcomes come back in input order.
+    """
+
+    paths = list(paths)
+    if len(paths) <= 1:
+        # Release the primitives' shared document handles once the run is
+        # over instead of leaving them to LRU eviction.
+        with shared_pdfs():
+            return [run_pipeline(path, config_dir) for path in paths]
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(paths)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(partial(run_pipeline, config_dir=config_dir), paths, chunksize=4))
+
+
 def run_highlight(input_path: Path, config_dir: Path) -> RedactionOutcome:
-    defaults, strict_detections, reason = _prepare_detections(input_path, config_dir)
+    _config, strict_detections, reason = _prepare_detections(input_path, config_dir)
 
     if reason:
         return RedactionOutcome(
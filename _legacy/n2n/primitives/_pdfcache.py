@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+import fitz
+
+from n2n.models import ExtractionResult
+
+# Region-based primitives each used to open the source PDF themselves, so a
+# profile with N region fields parsed the same content stream N times. This
+# module keeps a small LRU of open document handles keyed on (path, mtime)
+# and memoizes per-region word lists and text so primitives asking for the
+# same crop share one extract pass. Extraction goes through PyMuPDF: the
+# word walk stays in MuPDF's C core, which is an order of magnitude faster
+# than the pdfplumber/pdfminer stack for text-plus-bbox reads, and the
+# renderers already depend on fitz.
+
+_MAX_OPEN_PDFS = 4
+
+
+class Word(NamedTuple):
+    """One extracted word; attribute access instead of dict hashing in the
+    grouping and bbox loops, and a compact tuple layout in the cache."""
+
+    text: str
+    x0: float
+    top: float
+    x1: float
+    bottom: float
+
+_CacheKey = Tuple[str, int]
+_RegionKey = Tuple[_CacheKey, int, Tuple[float, float, float, float]]
+
+_PDF_CACHE: "OrderedDict[_CacheKey, fitz.Document]" = OrderedDict()
+_REGION_WORDS: Dict[_RegionKey, List[Word]] = {}
+_REGION_TEXT: Dict[_RegionKey, str] = {}
+_REGION_BBOX: Dict[_RegionKey, Tuple[float, float, float, float]] = {}
+
+
+def _cache_key(extraction: ExtractionResult) -> _CacheKey:
+    path = Path(extraction.file_path)
+    return (str(path), path.stat().st_mtime_ns)
+
+
+def _region_key(key: _CacheKey, page_index: int, bbox) -> _RegionKey:
+    return (key, page_index, tuple(round(float(value), 2) for value in bbox))
+
+
+def _drop_regions(key: _CacheKey) -> None:
+    for cache in (_REGION_WORDS, _REGION_TEXT, _REGION_BBOX):
+        for region_key in [k for k in cache if k[0] == key]:
+            del cache[region_key]
+
+
+def get_pdf(extraction: ExtractionResult) -> fitz.Document:
+    """Return a shared open handle for the extraction's source PDF.
+
+    Keyed on (path, mtime) so an edited file is re-parsed rather than served
+    stale; once more than _MAX_OPEN_PDFS handles are live the least recently
+    used one is closed and its memoized regions are dropped.
+    """
+
+    key = _cache_key(extraction)
+    doc = _PDF_CACHE.get(key)
+    if doc is not None:
+        _PDF_CACHE.move_to_end(key)
+        return doc
+
+    doc = fitz.open(key[0])
+    _PDF_CACHE[key] = doc
+    while len(_PDF_CACHE) > _MAX_OPEN_PDFS:
+        stale_key, stale_doc = _PDF_CACHE.popitem(last=False)
+        stale_doc.close()
+        _drop_regions(stale_key)
+    return doc
+
+
+def resolve_bbox(
+    extraction: ExtractionResult, page_index: int, x_range, y_range
+) -> Tuple[float, float, float, float]:
+    """Convert fractional page ranges to pixel coordinates, once per region.
+
+    Every region field repeats the same ratio * page-dimension maths; the
+    result is memoized alongside the other per-region caches so M fields
+    sharing a page read the page rect once.
+    """
+
+    ranges = (float(x_range[0]), float(x_range[1]), float(y_range[0]), float(y_range[1]))
+    key = (_cache_key(extraction), page_index, ranges)
+    bbox = _REGION_BBOX.get(key)
+    if bbox is None:
+        rect = get_pdf(extraction)[page_index].rect
+        bbox = (
+            ranges[0] * rect.width,
+            ranges[2] * rect.height,
+            ranges[1] * rect.width,
+            ranges[3] * rect.height,
+        )
+        _REGION_BBOX[key] = bbox
+    return bbox
+
+
+def get_region_words(extraction: ExtractionResult, page_index: int, bbox) -> List[Word]:
+    """Words intersecting bbox as Word tuples (top-origin y)."""
+
+    key = _region_key(_cache_key(extraction), page_index, bbox)
+    words = _REGION_WORDS.get(key)
+    if words is None:
+        doc = get_pdf(extraction)
+        raw = doc[page_index].get_text("words", clip=fitz.Rect(*bbox))
+        words = [Word(w[4], w[0], w[1], w[2], w[3]) for w in raw]
+        _REGION_WORDS[key] = words
+    return words
+
+
+def close_pdfs() -> None:
+    """Close every cached handle and drop the memoized regions.
+
+    The LRU keeps handles open across primitives by design; callers that
+    own a whole run (batch drivers, long-lived services) can use this to
+    release file descriptors deterministically once the run is done.
+    """
+
+    while _PDF_CACHE:
+        key, doc = _PDF_CACHE.popitem(last=False)
+        doc.close()
+        _drop_regions(key)
+
+
+@contextmanager
+def shared_pdfs():
+    """Scope the document cache to a block: handles close on exit."""
+
+    try:
+        yield
+    finally:
+        close_pdfs()
+
+
+def get_region_text(extraction: ExtractionResult, page_index: int, bbox) -> str:
+    key = _region_key(_cache_key(extraction), page_index, bbox)
+    text = _REGION_TEXT.get(key)
+    if text is None:
+        doc = get_pdf(extraction)
+        text = doc[page_index].get_text("text", clip=fitz.Rect(*bbox)) or ""
+        _REGION_TEXT[key] = text
+    return text
+
+
+__all__ = [
+    "Word",
+    "close_pdfs",
+    "get_pdf",
+    "get_region_text",
+    "get_region_words",
+    "resolve_bbox",
+    "shared_pdfs",
+]
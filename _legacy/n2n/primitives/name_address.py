@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import math
 import re
 from typing import Dict, List, Tuple
 
-import pdfplumber
+import numpy as np
 
 from n2n.models import DetectionResult, ExtractionResult, PiiCategory, TextSpan
 from n2n.primitives import register_primitive
+from n2n.primitives._pdfcache import Word, get_pdf, get_region_words, resolve_bbox
 
 CURRENCY_TOKEN_RE = re.compile(
     r"""^[£]?\s*
@@ -16,53 +18,58 @@ CURRENCY_TOKEN_RE = re.compile(
         \s*$""",
     re.VERBOSE,
 )
+# Bound method so the per-token currency check skips the attribute lookup.
+_CURRENCY_MATCH = CURRENCY_TOKEN_RE.match
 NUMERIC_CHARS = set("0123456789.,-£$()")
 
 
-def _normalize_region_bbox(region: Dict[str, object], page_width: float, page_height: float) -> Tuple[float, float, float, float]:
-    x_range = region.get("x_range", (0.0, 1.0))
-    y_range = region.get("y_range", (0.0, 1.0))
-    x0 = float(x_range[0]) * page_width
-    x1 = float(x_range[1]) * page_width
-    y0 = float(y_range[0]) * page_height
-    y1 = float(y_range[1]) * page_height
-    return (x0, y0, x1, y1)
-
-
-def _group_words_by_line(words: List[dict]) -> List[List[dict]]:
+def _group_words_by_line(words: List[Word]) -> List[List[Word]]:
     if not words:
         return []
 
-    sorted_words = sorted(words, key=lambda w: (w["top"], w["x0"]))
-    lines: List[List[dict]] = []
-    current_line: List[dict] = []
-    current_top = None
+    # Column arrays plus a stable lexsort replace the Python sort over
+    # word records; the grouping scan then walks plain floats instead of
+    # attribute lookups. A line still breaks against its first word's top
+    # (not the previous word's), matching the original anchored grouping.
+    count = len(words)
+    tops = np.fromiter((w.top for w in words), dtype=np.float64, count=count)
+    x0s = np.fromiter((w.x0 for w in words), dtype=np.float64, count=count)
+    order = np.lexsort((x0s, tops)).tolist()
+    sorted_tops = tops[order].tolist()
 
-    for word in sorted_words:
-        top = float(word["top"])
-        if current_line and current_top is not None and abs(top - current_top) > 2.0:
+    lines: List[List[dict]] = []
+    current_line = [words[order[0]]]
+    anchor_top = sorted_tops[0]
+    for pos in range(1, count):
+        top = sorted_tops[pos]
+        if abs(top - anchor_top) > 2.0:
             lines.append(current_line)
-            current_line = [word]
-            current_top = top
+            current_line = [words[order[pos]]]
+            anchor_top = top
         else:
-            current_line.append(word)
-            current_top = top if current_top is None else current_top
-
-    if current_line:
-        lines.append(current_line)
+            current_line.append(words[order[pos]])
 
+    lines.append(current_line)
     return lines
 
 
-def _line_text(words: List[dict]) -> str:
-    return " ".join((word.get("text") or "").strip() for word in words if word.get("text"))
+def _line_text(words: List[Word]) -> str:
+    return " ".join(word.text.strip() for word in words if word.text)
 
 
-def _line_bbox(words: List[dict]) -> Tuple[float, float, float, float]:
-    x0 = min(float(word["x0"]) for word in words)
-    y0 = min(float(word["top"]) for word in words)
-    x1 = max(float(word["x1"]) for word in words)
-    y1 = max(float(word["bottom"]) for word in words)
+def _line_bbox(words: List[Word]) -> Tuple[float, float, float, float]:
+    # One pass over the words instead of four min/max generator scans.
+    x0 = y0 = math.inf
+    x1 = y1 = -math.inf
+    for word in words:
+        if word.x0 < x0:
+            x0 = word.x0
+        if word.top < y0:
+            y0 = word.top
+        if word.x1 > x1:
+            x1 = word.x1
+        if word.bottom > y1:
+            y1 = word.bottom
     return (x0, y0, x1, y1)
 
 
@@ -91,37 +98,40 @@ def detect_name_header(
         category = category_value
     primitive_name = field_cfg.get("primitive", "name_header")
 
-    with pdfplumber.open(str(extraction.file_path)) as pdf:
-        if page_index >= len(pdf.pages):
-            return []
-
-        page = pdf.pages[page_index]
-        bbox = _normalize_region_bbox(region_def, page.width, page.height)
-        cropped = page.crop(bbox)
-        words = cropped.extract_words() or []
-        for line_words in _group_words_by_line(words):
-            text = _line_text(line_words).strip()
-            if not _is_valid_header_line(text):
-                continue
-
-            span_bbox = _line_bbox(line_words)
-            detections.append(
-                DetectionResult(
-                    field_id=field_id,
-                    category=category,
-                    primitive=primitive_name,
-                    span=TextSpan(
-                        page_index=page_index,
-                        text=text,
-                        bbox=span_bbox,
-                    ),
-                    confidence=1.0,
-                    context=text,
-                )
+    pdf = get_pdf(extraction)
+    if page_index >= len(pdf):
+        return []
+
+    bbox = resolve_bbox(
+        extraction,
+        page_index,
+        region_def.get("x_range", (0.0, 1.0)),
+        region_def.get("y_range", (0.0, 1.0)),
+    )
+    words = get_region_words(extraction, page_index, bbox)
+    for line_words in _group_words_by_line(words):
+        text = _line_text(line_words).strip()
+        if not _is_valid_header_line(text):
+            continue
+
+        span_bbox = _line_bbox(line_words)
+        detections.append(
+            DetectionResult(
+                field_id=field_id,
+                category=category,
+                primitive=primitive_name,
+                span=TextSpan(
+                    page_index=page_index,
+                    text=text,
+                    bbox=span_bbox,
+                ),
+                confidence=1.0,
+                context=text,
             )
+        )
 
-            if field_id == "account_name":
-                break
+        if field_id == "account_name":
+            break
 
     return detections
 
@@ -130,25 +140,36 @@ def _is_valid_header_line(text: str) -> bool:
     if not text:
         return False
 
-    if not any(ch.isalpha() for ch in text):
+    # One fused pass over the characters instead of separate alpha scan,
+    # whitespace-strip join, and numeric count — same classification,
+    # a third of the iterations and no intermediate string.
+    has_alpha = False
+    non_space = 0
+    numeric_chars = 0
+    for ch in text:
+        if ch.isspace():
+            continue
+        non_space += 1
+        if ch.isalpha():
+            has_alpha = True
+        elif ch.isdigit() or ch in NUMERIC_CHARS:
+            numeric_chars += 1
+
+    if not has_alpha:
         return False
 
-    tokens = text.split()
-    currency_hits = sum(1 for tok in tokens if _looks_like_currency(tok))
+    currency_hits = sum(1 for tok in text.split() if _looks_like_currency(tok))
     if currency_hits >= 2:
         return False
 
-    stripped = "".join(ch for ch in text if not ch.isspace())
-    if stripped:
-        numeric_chars = sum(1 for ch in stripped if ch.isdigit() or ch in NUMERIC_CHARS)
-        if numeric_chars / len(stripped) > 0.6:
-            return False
+    if non_space and numeric_chars / non_space > 0.6:
+        return False
 
     return True
 
 
 def _looks_like_currency(token: str) -> bool:
-    return bool(CURRENCY_TOKEN_RE.match(token.strip()))
+    return bool(_CURRENCY_MATCH(token.strip()))
 
 
 __all__ = ["detect_name_header"]
@@ -1,15 +1,35 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, List
+import logging
+import os
+import sys
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping
 
 from n2n.models import DetectionResult, TextSpan
 
+LOGGER = logging.getLogger(__name__)
+
 PrimitiveFunc = Callable[[List[TextSpan], Dict[str, object]], List[DetectionResult]]
 _REGISTRY: Dict[str, PrimitiveFunc] = {}
+# Read-only view shared by list_primitives so callers never trigger a dict
+# copy; it tracks _REGISTRY live.
+_REGISTRY_VIEW: Mapping[str, PrimitiveFunc] = MappingProxyType(_REGISTRY)
 
 
 def register_primitive(name: str) -> Callable[[PrimitiveFunc], PrimitiveFunc]:
+    # Interned names make the per-dispatch dict lookups hit the identity
+    # fast path when callers pass literals or profile-loaded strings.
+    name = sys.intern(name)
+
     def decorator(func: PrimitiveFunc) -> PrimitiveFunc:
+        if name in _REGISTRY:
+            # A repeated name silently replaces the earlier implementation,
+            # which is almost always an accidental duplicate module; make it
+            # loud, and fatal under N2N_STRICT_REGISTRY.
+            if os.environ.get("N2N_STRICT_REGISTRY"):
+                raise ValueError(f"Primitive already registered: {name}")
+            LOGGER.warning("Primitive %r re-registered; replacing earlier implementation", name)
         _REGISTRY[name] = func
         return func
 
@@ -23,8 +43,8 @@ def get_primitive(name: str) -> PrimitiveFunc:
         raise ValueError(f"Unknown primitive: {name}") from exc
 
 
-def list_primitives() -> Dict[str, PrimitiveFunc]:
-    return dict(_REGISTRY)
+def list_primitives() -> Mapping[str, PrimitiveFunc]:
+    return _REGISTRY_VIEW
 
 
 __all__ = ["PrimitiveFunc", "register_primitive", "get_primitive", "list_primitives"]
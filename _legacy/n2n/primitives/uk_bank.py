@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import re
+import sys
 from typing import Dict, List, Sequence
 
 from n2n.models import DetectionResult, PiiCategory, TextSpan
@@ -9,13 +11,73 @@ from n2n.primitives import register_primitive
 SORT_CODE_PATTERN = re.compile(r"\b\d{2}-\d{2}-\d{2}\b")
 ACCOUNT_NUMBER_PATTERN = re.compile(r"\b\d{8}\b")
 IBAN_PATTERN = re.compile(r"\bGB[0-9A-Z]{2}[0-9A-Z ]{10,30}\b")
+# Characters that mark an 8-digit match as an amount rather than an
+# account number; bound once so the per-match check allocates nothing.
+_ACCNUM_NOISE = frozenset(".,£$")
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _iter_sort_codes(line: str):
+    """Yield dd-dd-dd matches by anchoring on hyphens via str.find.
+
+    Equivalent to SORT_CODE_PATTERN.finditer: the C-level find skips
+    straight to each hyphen candidate instead of the regex engine trying
+    every position, which is the bulk of the work on lines without sort
+    codes. Boundary checks mirror the pattern's \\b anchors.
+    """
+
+    find = line.find
+    n = len(line)
+    p = find("-", 2)
+    while p != -1:
+        start = p - 2
+        end = p + 6
+        if (
+            end <= n
+            and line[start:p].isdecimal()
+            and line[p + 3] == "-"
+            and line[p + 1 : p + 3].isdecimal()
+            and line[p + 4 : end].isdecimal()
+            and (start == 0 or not _is_word_char(line[start - 1]))
+            and (end == n or not _is_word_char(line[end]))
+        ):
+            yield line[start:end]
+            # finditer resumes at `end`, and a following match needs a
+            # non-word char after the digit at end-1, so the earliest its
+            # anchoring hyphen can sit is end+3; resuming at `end` itself
+            # would re-anchor on run-on hyphens ("12-34-56-78-90") and
+            # emit overlapping matches the regex never produces.
+            p = find("-", end + 3)
+        else:
+            p = find("-", p + 1)
+
+
+@functools.lru_cache(maxsize=64)
+def _keywords_pattern(keywords: tuple) -> re.Pattern[str]:
+    # One alternation of escaped literals scans the line once instead of
+    # once per keyword; cached because the same keyword sets recur for
+    # every line of a run.
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+@functools.lru_cache(maxsize=4096)
+def _lowered(text: str) -> str:
+    # Each span is scanned by several primitives in turn; memoizing the
+    # lowered form means one lowercase pass and one allocation per span
+    # instead of one per (primitive, span).
+    return text.lower()
 
 
 def _line_has_context(text: str, keywords: Sequence[str]) -> bool:
+    # An empty keyword list means "no context gate": callers check
+    # `keywords and not _line_has_context(...)` so every line passes.
+    # The False returned here is therefore never the deciding branch.
     if not keywords:
         return False
-    lower = text.lower()
-    return any(keyword in lower for keyword in keywords)
+    return _keywords_pattern(tuple(keywords)).search(_lowered(text)) is not None
 
 
 def _resolve_category(field_cfg: Dict[str, object], default: PiiCategory) -> PiiCategory:
@@ -60,19 +122,27 @@ def _pattern_detector(
     primitive: str,
 ) -> List[DetectionResult]:
     detections: List[DetectionResult] = []
-    field_id = str(field_cfg.get("id", primitive))
+    # field_id and primitive are a tiny vocabulary repeated across every
+    # detection of a run; interning shares one string object per value.
+    field_id = sys.intern(str(field_cfg.get("id", primitive)))
     keywords = [str(k).lower() for k in field_cfg.get("context_keywords", []) if str(k).strip()]
     category = _resolve_category(field_cfg, PiiCategory.BANK_IDENTIFIERS)
 
+    finditer = pattern.finditer
+    append = detections.append
     for span in spans:
         text = span.text or ""
         if keywords and not _line_has_context(text, keywords):
             continue
-        for match in pattern.finditer(text):
-            detections.append(
+        if pattern is SORT_CODE_PATTERN:
+            matches = _iter_sort_codes(text)
+        else:
+            matches = (m.group() for m in finditer(text))
+        for match_text in matches:
+            append(
                 _build_detection(
                     span=span,
-                    match_text=match.group(),
+                    match_text=match_text,
                     field_id=field_id,
                     category=category,
                     primitive=primitive,
@@ -92,7 +162,7 @@ def detect_uk_account_number_8d(spans: List[TextSpan], field_cfg: Dict[str, obje
     filtered: List[DetectionResult] = []
     for det in detections:
         text = det.span.text.strip()
-        if any(ch in text for ch in ".,£$"):
+        if not _ACCNUM_NOISE.isdisjoint(text):
             continue
         filtered.append(det)
     return filtered
@@ -1,35 +1,72 @@
 from __future__ import annotations
 
+import functools
 import re
+import sys
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
-import pdfplumber
-
 from n2n.models import DetectionResult, ExtractionResult, PiiCategory, TextSpan
 from n2n.primitives import register_primitive
+from n2n.primitives._pdfcache import get_pdf, get_region_text, resolve_bbox
 
 NI_PATTERN = re.compile(r"\b(?!BG)(?!GB)(?!NK)(?!KN)(?!TN)(?!NT)(?!ZZ)[A-CEGHJ-PR-TW-Z]{2}\d{6}[A-D]?\b")
 NHS_PATTERN = re.compile(r"\b\d{3}\s?\d{3}\s?\d{4}\b")
 DRIVING_PATTERN = re.compile(r"\b[A-Z9]{5}\d{6}[A-Z9]{2}\d{2}\b")
 PASSPORT_PATTERN = re.compile(r"\b\d{9}\b")
 POSTCODE_PATTERN = re.compile(r"\b([A-Z]{1,2}\d[A-Z\d]?)\s?(\d[A-Z]{2})\b")
+# Bound method so per-line loops skip the attribute lookup on each call.
+_POSTCODE_SEARCH = POSTCODE_PATTERN.search
+# Every postcode ends digit + two uppercase letters; this much simpler
+# scan rejects the vast majority of lines before the full pattern runs.
+_POSTCODE_SUFFIX_SEARCH = re.compile(r"\d[A-Z]{2}\b").search
 
 ADDRESS_KEYWORDS = ["road", "street", "avenue", "lane", "close", "drive", "flat", "house", "no.", "building"]
+# Single alternation over the address keywords: one scan of the lowered
+# line replaces ten separate substring passes.
+_ADDRESS_KEYWORD_RE = re.compile("|".join(re.escape(keyword) for keyword in ADDRESS_KEYWORDS))
+
+
+def _pages_lines(extraction: ExtractionResult) -> Tuple[Tuple[str, ...], ...]:
+    # splitlines re-scans and re-allocates the whole page per call, and
+    # every unbatched primitive iterates the same pages; cache the split
+    # result on the extraction so it happens once per document.
+    cached = getattr(extraction, "_pages_lines", None)
+    if cached is None:
+        cached = tuple(
+            tuple(page_text.splitlines()) if page_text else () for page_text in extraction.pages
+        )
+        extraction._pages_lines = cached
+    return cached
 
 
 def _iter_lines(extraction: ExtractionResult) -> Iterable[Tuple[int, str]]:
-    for page_index, page_text in enumerate(extraction.pages):
-        if not page_text:
-            continue
-        for line in page_text.splitlines():
+    for page_index, lines in enumerate(_pages_lines(extraction)):
+        for line in lines:
             yield page_index, line
 
 
+@functools.lru_cache(maxsize=64)
+def _keywords_pattern(keywords: tuple) -> re.Pattern[str]:
+    # One alternation of escaped literals scans the line once instead of
+    # once per keyword; cached because the same keyword sets recur for
+    # every line of a run.
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+@functools.lru_cache(maxsize=4096)
+def _lowered(line: str) -> str:
+    # The unbatched detect_* entry points all visit the same lines; memoize
+    # the lowered form so it is computed once per line, not once per field.
+    return line.lower()
+
+
 def _line_has_context(line: str, keywords: Sequence[str]) -> bool:
+    # KYC fields require context: _detect_regex_with_context bails out
+    # earlier when a field has no keywords, so unlike uk_bank (where an
+    # empty list means "no gate") these detectors never run ungated.
     if not keywords:
         return False
-    lower = line.lower()
-    return any(keyword in lower for keyword in keywords)
+    return _keywords_pattern(tuple(keywords)).search(_lowered(line)) is not None
 
 
 def _build_detection(
@@ -40,7 +77,10 @@ def _build_detection(
     category_default: PiiCategory,
     context_line: str,
 ) -> DetectionResult:
-    field_id = str(field_cfg.get("id", primitive))
+    # Callers pass context_line already stripped (once per line, not once
+    # per match); field_id and primitive come from tiny vocabularies, so
+    # interning makes every detection share the same string objects.
+    field_id = sys.intern(str(field_cfg.get("id", primitive)))
     category_value = field_cfg.get("category", category_default)
     if isinstance(category_value, str):
         try:
@@ -53,14 +93,14 @@ def _build_detection(
     return DetectionResult(
         field_id=field_id,
         category=category,
-        primitive=primitive,
+        primitive=sys.intern(primitive),
         span=TextSpan(
             page_index=page_index,
             text=text,
             bbox=(0.0, 0.0, 0.0, 0.0),
         ),
         confidence=1.0,
-        context=context_line.strip(),
+        context=context_line,
     )
 
 
@@ -101,23 +141,113 @@ def _detect_regex_with_context(
     if not keywords:
         return detections
 
+    # Locals for the two attribute lookups the line loop repeats; the
+    # remaining per-line cost is the regex calls themselves.
+    finditer = pattern.finditer
+    append = detections.append
     for page_index, line in _candidate_lines(extraction, field_cfg):
         if not _line_has_context(line, keywords):
             continue
-        for match in pattern.finditer(line):
-            detections.append(
+        context = line.strip()
+        for match in finditer(line):
+            append(
                 _build_detection(
                     page_index=page_index,
                     text=match.group(),
                     field_cfg=field_cfg,
                     primitive=primitive,
                     category_default=category_default,
-                    context_line=line,
+                    context_line=context,
                 )
             )
     return detections
 
 
+# Context-keyword primitives that can share a single pass over the lines;
+# maps primitive name to (pattern, default category).
+_CONTEXT_PATTERNS = {
+    "uk_ni_number": (NI_PATTERN, PiiCategory.GOV_IDENTIFIERS),
+    "uk_nhs_number": (NHS_PATTERN, PiiCategory.GOV_IDENTIFIERS),
+    "uk_driving_licence": (DRIVING_PATTERN, PiiCategory.GOV_IDENTIFIERS),
+    "uk_passport_number": (PASSPORT_PATTERN, PiiCategory.GOV_IDENTIFIERS),
+}
+
+# All four patterns merged into one alternation so the batched driver
+# enters the regex engine once per line; group names double as primitive
+# names and m.lastgroup identifies which field matched. The word-boundary
+# anchors keep the branches token-disjoint, so a merged scan finds the
+# same matches as running the patterns separately.
+UK_KYC_PATTERN = re.compile(
+    rf"(?P<uk_ni_number>{NI_PATTERN.pattern})"
+    rf"|(?P<uk_nhs_number>{NHS_PATTERN.pattern})"
+    rf"|(?P<uk_driving_licence>{DRIVING_PATTERN.pattern})"
+    rf"|(?P<uk_passport_number>{PASSPORT_PATTERN.pattern})"
+)
+
+
+def detect_kyc_fields(
+    extraction: ExtractionResult, field_cfgs: Sequence[Dict[str, object]]
+) -> List[DetectionResult]:
+    """Run several context-keyword primitives in one pass over the document.
+
+    Calling each detect_* separately re-iterates and re-lowers every line
+    once per field. This driver splits and lowers each line exactly once
+    and fans out to every whole-document field whose keyword pattern hits;
+    region-scoped fields keep their own (cached) region extraction.
+    Detections for the batched fields come back grouped by line rather
+    than by field.
+    """
+
+    detections: List[DetectionResult] = []
+    jobs = []
+    for field_cfg in field_cfgs:
+        primitive = str(field_cfg.get("primitive", ""))
+        entry = _CONTEXT_PATTERNS.get(primitive)
+        if entry is None:
+            continue
+        pattern, category_default = entry
+        keywords = _require_context_keywords(field_cfg)
+        if not keywords:
+            continue
+        if _resolve_region_bounds(field_cfg):
+            detections.extend(
+                _detect_regex_with_context(extraction, pattern, field_cfg, primitive, category_default)
+            )
+        else:
+            jobs.append((pattern, _keywords_pattern(tuple(keywords)), field_cfg, primitive, category_default))
+
+    if not jobs:
+        return detections
+
+    kyc_finditer = UK_KYC_PATTERN.finditer
+    append = detections.append
+    for page_index, line in _iter_lines(extraction):
+        lower = line.lower()
+        active: Dict[str, List[Tuple[Dict[str, object], PiiCategory]]] = {}
+        for _pattern, keyword_re, field_cfg, primitive, category_default in jobs:
+            if keyword_re.search(lower) is not None:
+                active.setdefault(primitive, []).append((field_cfg, category_default))
+        if not active:
+            continue
+
+        # One merged scan per gated line; lastgroup routes each match to
+        # the primitive whose branch produced it.
+        context = line.strip()
+        for match in kyc_finditer(line):
+            for field_cfg, category_default in active.get(match.lastgroup, ()):
+                append(
+                    _build_detection(
+                        page_index=page_index,
+                        text=match.group(),
+                        field_cfg=field_cfg,
+                        primitive=match.lastgroup,
+                        category_default=category_default,
+                        context_line=context,
+                    )
+                )
+    return detections
+
+
 @register_primitive("uk_ni_number")
 def detect_uk_ni_number(extraction: ExtractionResult, field_cfg: Dict[str, object]) -> List[DetectionResult]:
     return _detect_regex_with_context(
@@ -171,24 +301,20 @@ def _extract_region_lines(extraction: ExtractionResult, region_def: Optional[Dic
     if page_index >= len(extraction.pages):
         return []
 
-    with pdfplumber.open(str(extraction.file_path)) as pdf:
-        if page_index >= len(pdf.pages):
-            return []
-        page = pdf.pages[page_index]
-        x_range = region_def.get("x_range", (0.0, 1.0))
-        y_range = region_def.get("y_range", (0.0, 1.0))
-        bbox = (
-            float(x_range[0]) * page.width,
-            float(y_range[0]) * page.height,
-            float(x_range[1]) * page.width,
-            float(y_range[1]) * page.height,
-        )
-        cropped = page.crop(bbox)
-        region_text = cropped.extract_text() or ""
-        for line in region_text.splitlines():
-            text = line.strip()
-            if text:
-                results.append((page_index, text))
+    pdf = get_pdf(extraction)
+    if page_index >= len(pdf):
+        return []
+    bbox = resolve_bbox(
+        extraction,
+        page_index,
+        region_def.get("x_range", (0.0, 1.0)),
+        region_def.get("y_range", (0.0, 1.0)),
+    )
+    region_text = get_region_text(extraction, page_index, bbox)
+    for line in region_text.splitlines():
+        text = line.strip()
+        if text:
+            results.append((page_index, text))
 
     return results
 
@@ -208,6 +334,9 @@ def detect_uk_postcode_enhanced(extraction: ExtractionResult, field_cfg: Dict[st
         return []
 
     for page_index, line in lines:
+        if _POSTCODE_SUFFIX_SEARCH(line) is None:
+            continue
+        context = line.strip()
         for match in POSTCODE_PATTERN.finditer(line):
             detections.append(
                 _build_detection(
@@ -216,17 +345,16 @@ def detect_uk_postcode_enhanced(extraction: ExtractionResult, field_cfg: Dict[st
                     field_cfg=field_cfg,
                     primitive="uk_postcode_enhanced",
                     category_default=PiiCategory.CUSTOMER_IDENTITY,
-                    context_line=line,
+                    context_line=context,
                 )
             )
     return detections
 
 
 def _line_matches_address(text: str) -> bool:
-    lower = text.lower()
-    if POSTCODE_PATTERN.search(text):
+    if _POSTCODE_SUFFIX_SEARCH(text) is not None and _POSTCODE_SEARCH(text):
         return True
-    return any(keyword in lower for keyword in ADDRESS_KEYWORDS)
+    return _ADDRESS_KEYWORD_RE.search(_lowered(text)) is not None
 
 
 @register_primitive("uk_address_line")
@@ -256,6 +384,7 @@ def detect_uk_address_line(extraction: ExtractionResult, field_cfg: Dict[str, ob
 
 
 __all__ = [
+    "detect_kyc_fields",
     "detect_uk_ni_number",
     "detect_uk_nhs_number",
     "detect_uk_driving_licence",
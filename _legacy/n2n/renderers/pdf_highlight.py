@@ -1,10 +1,10 @@
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 from typing import List, Sequence, Tuple
 
 import fitz
-import pdfplumber
 
 from n2n.models import DetectionResult
 
@@ -13,6 +13,18 @@ HIGHLIGHT_SUFFIX = "_highlighted"
 BBox = Tuple[float, float, float, float]
 
 
+def _page_words(page: "fitz.Page") -> List[dict]:
+    # Word boxes from the already-open fitz page; same shape pdfplumber's
+    # extract_words produced, without the second full parse of the file.
+    # Whitespace-only words are dropped here so every detection on the
+    # page shares one cleaned list instead of re-filtering it.
+    return [
+        {"text": w[4], "x0": w[0], "top": w[1], "x1": w[2], "bottom": w[3]}
+        for w in page.get_text("words")
+        if w[4].strip()
+    ]
+
+
 def _build_bbox_from_words(words: Sequence[dict]) -> BBox:
     x0 = min(float(word["x0"]) for word in words)
     y0 = min(float(word["top"]) for word in words)
@@ -22,71 +34,94 @@ def _build_bbox_from_words(words: Sequence[dict]) -> BBox:
 
 
 def _find_word_sequences_for_text(words: Sequence[dict], target_text: str) -> List[BBox]:
+    # The page text is joined once and each candidate start is tested with
+    # a single startswith against the precomputed word offset — O(n) scans
+    # instead of the old nested join loop that rebuilt candidate strings
+    # (O(n^2) allocations) for every start position.
     target = target_text.strip()
     if not target:
         return []
 
-    clean_words = [word for word in words if (word.get("text") or "").strip()]
-    matches: List[BBox] = []
-    n = len(clean_words)
+    texts = [word["text"].strip() for word in words]
+    joined = " ".join(texts)
+    offsets: List[int] = []
+    pos = 0
+    for text in texts:
+        offsets.append(pos)
+        pos += len(text) + 1
 
-    for start in range(n):
-        text_parts: List[str] = []
-        for end in range(start, n):
-            word_text = (clean_words[end].get("text") or "").strip()
-            text_parts.append(word_text)
-            candidate = " ".join(text_parts).strip()
+    first_token = target.split(" ", 1)[0]
+    token_count = target.count(" ") + 1
+    target_len = len(target)
+    joined_len = len(joined)
 
-            if candidate == target:
-                matches.append(_build_bbox_from_words(clean_words[start : end + 1]))
-                break
-
-            if len(candidate) > len(target):
-                break
+    matches: List[BBox] = []
+    for index, text in enumerate(texts):
+        if text != first_token:
+            continue
+        start_char = offsets[index]
+        end_char = start_char + target_len
+        if joined.startswith(target, start_char) and (
+            end_char == joined_len or joined[end_char] == " "
+        ):
+            matches.append(_build_bbox_from_words(words[index : index + token_count]))
 
     return matches
 
 
-def highlight_pdf(input_pdf: Path, detections: List[DetectionResult]) -> Path:
-    """Produce a highlighted PDF showing detected spans using real coordinates."""
+def highlight_pdf(
+    input_pdf: Path,
+    detections: List[DetectionResult],
+    doc: "fitz.Document | None" = None,
+) -> Path:
+    """Produce a highlighted PDF showing detected spans using real coordinates.
+
+    A caller that already holds an open document can pass it via ``doc`` to
+    skip the re-parse; the document is then left open for further passes.
+    """
 
     output_path = input_pdf.with_name(f"{input_pdf.stem}{HIGHLIGHT_SUFFIX}.pdf")
 
-    doc = fitz.open(str(input_pdf))
-    plumber_pdf = pdfplumber.open(str(input_pdf))
+    if not detections:
+        # Nothing to annotate: a byte copy beats re-serializing the whole
+        # document through the PDF writer.
+        shutil.copyfile(input_pdf, output_path)
+        return output_path
 
-    try:
-        if not detections:
-            doc.save(str(output_path))
-            return output_path
+    owns_doc = doc is None
+    if owns_doc:
+        doc = fitz.open(str(input_pdf))
 
+    try:
+        # Group by page so each page object is resolved and its words
+        # extracted once, no matter how many detections land on it.
+        by_page: dict[int, List[DetectionResult]] = {}
         for det in detections:
             page_index = det.span.page_index
-            if page_index < 0 or page_index >= len(plumber_pdf.pages):
-                continue
-
-            span_text = (det.span.text or "").strip()
-            if not span_text:
-                continue
-
-            words = plumber_pdf.pages[page_index].extract_words() or []
-            matches = _find_word_sequences_for_text(words, span_text)
-            if not matches:
-                continue
+            if 0 <= page_index < len(doc) and (det.span.text or "").strip():
+                by_page.setdefault(page_index, []).append(det)
 
+        for page_index, page_dets in by_page.items():
             page = doc[page_index]
-            for bbox in matches:
-                rect = fitz.Rect(*bbox)
-                annot = page.add_highlight_annot(rect)
+            words = _page_words(page)
+            # One annotation holding every quad on the page instead of one
+            # annot object per match: far fewer objects written on save.
+            quads: List[fitz.Quad] = []
+            for det in page_dets:
+                matches = _find_word_sequences_for_text(words, det.span.text.strip())
+                for bbox in matches:
+                    quads.append(fitz.Rect(*bbox).quad)
+                    det.span.bbox = bbox
+            if quads:
+                annot = page.add_highlight_annot(quads)
                 annot.set_colors(stroke=(1.0, 1.0, 0.0))
                 annot.set_opacity(0.4)
                 annot.update()
-                det.span.bbox = bbox
 
-        doc.save(str(output_path))
+        doc.save(str(output_path), garbage=3, deflate=True)
     finally:
-        doc.close()
-        plumber_pdf.close()
+        if owns_doc:
+            doc.close()
 
     return output_path
 
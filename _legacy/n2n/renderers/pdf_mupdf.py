@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 from typing import List, Sequence, Tuple
 
 import fitz  # PyMuPDF
-import pdfplumber
 
 from n2n.models import DetectionResult
 
 BBox = Tuple[float, float, float, float]
 
 
+def _page_words(page: "fitz.Page") -> List[dict]:
+    # Word boxes from the already-open fitz page; same shape pdfplumber's
+    # extract_words produced, without the second full parse of the file.
+    # Whitespace-only words are dropped here so every detection on the
+    # page shares one cleaned list instead of re-filtering it.
+    return [
+        {"text": w[4], "x0": w[0], "top": w[1], "x1": w[2], "bottom": w[3]}
+        for w in page.get_text("words")
+        if w[4].strip()
+    ]
+
+
 def _build_bbox_from_words(words: Sequence[dict]) -> BBox:
     x0 = min(float(word["x0"]) for word in words)
     y0 = min(float(word["top"]) for word in words)
@@ -20,27 +32,37 @@ def _build_bbox_from_words(words: Sequence[dict]) -> BBox:
 
 
 def _find_word_sequences_for_text(words: Sequence[dict], target_text: str) -> List[BBox]:
+    # The page text is joined once and each candidate start is tested with
+    # a single startswith against the precomputed word offset — O(n) scans
+    # instead of the old nested join loop that rebuilt candidate strings
+    # (O(n^2) allocations) for every start position.
     target = target_text.strip()
     if not target:
         return []
 
-    clean_words = [word for word in words if (word.get("text") or "").strip()]
-    matches: List[BBox] = []
-    n = len(clean_words)
+    texts = [word["text"].strip() for word in words]
+    joined = " ".join(texts)
+    offsets: List[int] = []
+    pos = 0
+    for text in texts:
+        offsets.append(pos)
+        pos += len(text) + 1
 
-    for start in range(n):
-        text_parts: List[str] = []
-        for end in range(start, n):
-            word_text = (clean_words[end].get("text") or "").strip()
-            text_parts.append(word_text)
-            candidate = " ".join(text_parts).strip()
+    first_token = target.split(" ", 1)[0]
+    token_count = target.count(" ") + 1
+    target_len = len(target)
+    joined_len = len(joined)
 
-            if candidate == target:
-                matches.append(_build_bbox_from_words(clean_words[start : end + 1]))
-                break
-
-            if len(candidate) > len(target):
-                break
+    matches: List[BBox] = []
+    for index, text in enumerate(texts):
+        if text != first_token:
+            continue
+        start_char = offsets[index]
+        end_char = start_char + target_len
+        if joined.startswith(target, start_char) and (
+            end_char == joined_len or joined[end_char] == " "
+        ):
+            matches.append(_build_bbox_from_words(words[index : index + token_count]))
 
     return matches
 
@@ -64,44 +86,66 @@ def apply_redactions(
     input_pdf: Path,
     detections: List[DetectionResult],
     output_pdf: Path,
+    doc: "fitz.Document | None" = None,
 ) -> Path:
     """
-    Apply real redactions: pdfplumber locates word-level bounding boxes for each
-    detection and PyMuPDF draws solid redact annotations so the text is removed.
+    Apply real redactions: word-level bounding boxes are located for each
+    detection and PyMuPDF draws solid redact annotations so the text is
+    removed. A caller that already holds an open document can pass it via
+    ``doc`` to skip the re-parse; the document is then left open.
     """
 
     if not detections:
+        # No-op render: copy the bytes so the promised output exists
+        # without a full serialization pass. An incremental in-place save
+        # is deliberately not offered here — appending to the original
+        # file would keep the redacted content recoverable from the
+        # previous generation of the PDF.
+        if Path(output_pdf).resolve() != Path(input_pdf).resolve():
+            shutil.copyfile(input_pdf, output_pdf)
         return output_pdf
 
-    doc = fitz.open(str(input_pdf))
-    plumber_pdf = pdfplumber.open(str(input_pdf))
+    owns_doc = doc is None
+    if owns_doc:
+        doc = fitz.open(str(input_pdf))
 
     try:
-        pages_to_apply = set()
-
+        # Group by page so each page object is resolved and its words
+        # extracted once, no matter how many detections land on it; the
+        # redactions are then applied page by page on the same handle.
+        by_page: dict[int, List[DetectionResult]] = {}
         for det in detections:
             page_index = det.span.page_index
-            if page_index < 0 or page_index >= len(plumber_pdf.pages):
-                continue
-
-            words = plumber_pdf.pages[page_index].extract_words() or []
-            bboxes = _resolve_bboxes_for_detection(words, det)
-            if not bboxes:
-                continue
+            if 0 <= page_index < len(doc):
+                by_page.setdefault(page_index, []).append(det)
 
+        for page_index, page_dets in by_page.items():
             page = doc[page_index]
-            for bbox in bboxes:
-                rect = fitz.Rect(*bbox)
-                page.add_redact_annot(rect, fill=(0, 0, 0))
-                pages_to_apply.add(page_index)
-
-        for page_index in pages_to_apply:
-            doc[page_index].apply_redactions()
-
-        doc.save(str(output_pdf))
+            # Word extraction is only needed for detections that arrive
+            # without a resolved bbox; pages where every span already has
+            # coordinates (the common pipeline path) skip it entirely.
+            words: List[dict] | None = None
+            annotated = False
+            for det in page_dets:
+                bbox = det.span.bbox
+                if bbox and tuple(bbox) != (0.0, 0.0, 0.0, 0.0):
+                    bboxes: List[BBox] = [bbox]
+                else:
+                    if words is None:
+                        words = _page_words(page)
+                    bboxes = _resolve_bboxes_for_detection(words, det)
+                for bbox in bboxes:
+                    page.add_redact_annot(fitz.Rect(*bbox), fill=(0, 0, 0))
+                    annotated = True
+            if annotated:
+                page.apply_redactions()
+
+        # Full rewrite with garbage collection so the removed text leaves
+        # no orphaned objects behind; deflate keeps the output compact.
+        doc.save(str(output_pdf), garbage=3, deflate=True)
     finally:
-        doc.close()
-        plumber_pdf.close()
+        if owns_doc:
+            doc.close()
 
     return output_pdf
 
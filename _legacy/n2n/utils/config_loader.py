@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Any, Dict
 
@@ -14,11 +15,17 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
     return data or {}
 
 
+# Memoized on the (resolved) arguments: config YAML is static for the
+# life of a process, and repeated invocations from the dev tooling were
+# reparsing it every time. Callers treat the returned dicts as
+# read-only; use cache_clear() after editing config on disk.
+@functools.lru_cache(maxsize=16)
 def load_global_config(base_dir: Path) -> Dict[str, Any]:
     cfg_path = base_dir / "config" / "n2n.defaults.yaml"
     return _load_yaml(cfg_path)
 
 
+@functools.lru_cache(maxsize=16)
 def load_profile_config(base_dir: Path, country: str, profile: str) -> Dict[str, Any]:
     cfg_path = base_dir / "config" / "profiles" / country / f"{profile}.yaml"
     return _load_yaml(cfg_path)
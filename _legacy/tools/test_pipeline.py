@@ -31,8 +31,17 @@ def main() -> None:
         default="highlight",
         help="Whether to run the redaction or highlight output",
     )
+    parser.add_argument(
+        "--reload",
+        action="store_true",
+        help="Drop the cached config and reparse the YAML from disk",
+    )
     args = parser.parse_args()
 
+    if args.reload:
+        load_global_config.cache_clear()
+        load_profile_config.cache_clear()
+
     pdf_path = Path(args.file).expanduser().resolve()
     if not pdf_path.exists():
         raise SystemExit(f"File not found: {pdf_path}")
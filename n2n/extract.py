@@ -64,6 +64,52 @@ def extract_spans(
     return spans, artifacts, stats
 
 
+def extract_spans_regions(
+    input_file: str | Path | fitz.Document,
+    regions: Sequence[Tuple[int, Tuple[float, float, float, float]]],
+    pad: float = 4.0,
+) -> List[TextSpan]:
+    """OCR only the given (page_index, bbox) regions of a PDF.
+
+    Regions are in PDF points. Each one is rendered with a clip at the usual
+    zoom and recognized on its own, so re-checking a handful of redacted
+    areas costs a fraction of a full-document re-extract. Returned span
+    bboxes are mapped back to page coordinates. Callers that already hold an
+    open ``fitz.Document`` can pass it directly to skip a re-parse; it is
+    left open for them to close.
+    """
+    spans: List[TextSpan] = []
+    if isinstance(input_file, fitz.Document):
+        doc = input_file
+        owns_doc = False
+    else:
+        path = Path(input_file).expanduser().resolve()
+        doc = fitz.open(str(path))
+        owns_doc = True
+    try:
+        mat = fitz.Matrix(ZOOM, ZOOM)
+        for page_index, bbox in regions:
+            if page_index < 0 or page_index >= len(doc):
+                continue
+            page = doc[page_index]
+            clip = fitz.Rect(bbox[0] - pad, bbox[1] - pad, bbox[2] + pad, bbox[3] + pad) & page.rect
+            if clip.is_empty:
+                continue
+            pix = page.get_pixmap(matrix=mat, clip=clip)
+            image = Image.frombytes(
+                "RGB" if pix.alpha == 0 else "RGBA", [pix.width, pix.height], pix.samples
+            )
+            region_spans, _ = _ocr_image(image, page_index, scale=1 / ZOOM)
+            for span in region_spans:
+                x1, y1, x2, y2 = span.bbox
+                span.bbox = (x1 + clip.x0, y1 + clip.y0, x2 + clip.x0, y2 + clip.y0)
+            spans.extend(region_spans)
+    finally:
+        if owns_doc:
+            doc.close()
+    return spans
+
+
 def _extract_pdf_text(path: Path) -> List[TextSpan]:
     spans: List[TextSpan] = []
     if not path.exists():
@@ -229,4 +275,4 @@ def _total_chars(spans: List[TextSpan]) -> int:
     return sum(len(span.text.strip()) for span in spans)
 
 
-__all__ = ["extract_spans"]
+__all__ = ["extract_spans", "extract_spans_regions"]
@@ -4,7 +4,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+import cv2
 import fitz
+import numpy as np
 from PIL import Image, ImageOps
 
 
@@ -17,6 +19,9 @@ class PageImage:
     scale: float
     render_dpi: int
     source: str
+    # Already-decoded BGR pixels from the render step; spares consumers a
+    # PNG decode round-trip when set.
+    array: np.ndarray | None = None
 
 
 def prepare_input_images(input_path: Path, outdir: Path, dpi: int = 350) -> Tuple[List[PageImage], Dict[str, object]]:
@@ -35,6 +40,11 @@ def prepare_input_images(input_path: Path, outdir: Path, dpi: int = 350) -> Tupl
                 pix = page.get_pixmap(matrix=matrix)
                 out_path = pages_dir / f"{input_path.stem}_page_{idx + 1}.png"
                 pix.save(str(out_path))
+                array = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+                if pix.n == 4:
+                    array = cv2.cvtColor(array, cv2.COLOR_RGBA2BGR)
+                else:
+                    array = cv2.cvtColor(array, cv2.COLOR_RGB2BGR)
                 page_images.append(
                     PageImage(
                         index=idx,
@@ -44,6 +54,7 @@ def prepare_input_images(input_path: Path, outdir: Path, dpi: int = 350) -> Tupl
                         scale=scale,
                         render_dpi=dpi,
                         source="pdf",
+                        array=array,
                     )
                 )
         finally:
@@ -56,6 +67,11 @@ def prepare_input_images(input_path: Path, outdir: Path, dpi: int = 350) -> Tupl
         width, height = image.size
         out_path = pages_dir / f"{input_path.stem}_page_1.png"
         image.save(out_path)
+        array = np.asarray(image)
+        if array.ndim == 2:
+            array = cv2.cvtColor(array, cv2.COLOR_GRAY2BGR)
+        else:
+            array = cv2.cvtColor(array, cv2.COLOR_RGB2BGR)
         page_images.append(
             PageImage(
                 index=0,
@@ -65,6 +81,7 @@ def prepare_input_images(input_path: Path, outdir: Path, dpi: int = 350) -> Tupl
                 scale=1.0,
                 render_dpi=dpi,
                 source="image",
+                array=array,
             )
         )
 
@@ -5,7 +5,10 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 
-@dataclass
+# Spans are allocated once per OCR word; slots drop the per-instance
+# __dict__. DetectionResult stays unslotted — DecisionReport.to_dict
+# serializes it through __dict__.
+@dataclass(slots=True)
 class TextSpan:
     text: str
     bbox: Tuple[float, float, float, float]
@@ -6,6 +6,8 @@ from n2n.ocr.registry import (
     get_backends_for_mode,
     resolve_backend_mode,
     run_ocr_backends,
+    run_ocr_backends_async,
+    run_ocr_backends_batch,
 )
 
 __all__ = [
@@ -16,4 +18,6 @@ __all__ = [
     "get_backends_for_mode",
     "resolve_backend_mode",
     "run_ocr_backends",
+    "run_ocr_backends_async",
+    "run_ocr_backends_batch",
 ]
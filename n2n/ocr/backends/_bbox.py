@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from n2n.ocr.backends.base import BBox
+
+
+def normalize_bboxes(boxes: np.ndarray, shape: Tuple[int, ...]) -> np.ndarray:
+    """Clamp an (N, 4) array of bboxes to image bounds in one vectorized pass.
+
+    Clips in place when ``boxes`` is already int32; guarantees x2 > x1 and
+    y2 > y1 so downstream slices are never empty on that axis.
+    """
+    height, width = shape[:2]
+    boxes = np.asarray(boxes, dtype=np.int32).reshape(-1, 4)
+    np.clip(boxes, [0, 0, 0, 0], [width - 1, height - 1, width, height], out=boxes)
+    np.maximum(boxes[:, 2], boxes[:, 0] + 1, out=boxes[:, 2])
+    np.maximum(boxes[:, 3], boxes[:, 1] + 1, out=boxes[:, 3])
+    return boxes
+
+
+def normalize_bbox(box: BBox, shape: Tuple[int, ...]) -> Tuple[int, int, int, int]:
+    x1, y1, x2, y2 = normalize_bboxes(np.array([box], dtype=np.int32), shape)[0]
+    return int(x1), int(y1), int(x2), int(y2)
+
+
+__all__ = ["normalize_bbox", "normalize_bboxes"]
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import threading
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# Small shape-keyed pool so repeated same-size ROI conversions reuse buffers
+# instead of hitting the allocator per call. Capped to bound memory.
+_BUF_POOL: Dict[Tuple[int, ...], List[np.ndarray]] = {}
+_POOL_LOCK = threading.Lock()
+_MAX_POOLED = 32
+
+
+def get_buf(shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+    key = tuple(shape)
+    with _POOL_LOCK:
+        bucket = _BUF_POOL.get(key)
+        if bucket:
+            return bucket.pop()
+    return np.empty(shape, dtype=dtype)
+
+
+def release_buf(buf: np.ndarray) -> None:
+    with _POOL_LOCK:
+        if sum(len(bucket) for bucket in _BUF_POOL.values()) >= _MAX_POOLED:
+            return
+        _BUF_POOL.setdefault(buf.shape, []).append(buf)
+
+
+__all__ = ["get_buf", "release_buf"]
@@ -12,6 +12,7 @@ from typing import List
 import cv2
 import numpy as np
 
+from n2n.ocr.backends._bbox import normalize_bbox
 from n2n.ocr.backends.base import (
     BBox,
     BackendUnavailable,
@@ -37,7 +38,7 @@ class AppleVisionBackend(OCRBackend):
             raise BackendUnavailable(
                 f"Apple Vision backend not available. Build the helper via `swift build -c release` in {self.binary_path.parent.parent}"
             )
-        x1, y1, x2, y2 = _normalize_bbox(roi_bbox, image.shape)
+        x1, y1, x2, y2 = normalize_bbox(roi_bbox, image.shape)
         roi = image[y1:y2, x1:x2]
         if roi.size == 0:
             return OCRResult(text="", avg_conf=0.0, words=[], engine=self.name, elapsed_ms=0.0)
@@ -89,13 +90,4 @@ class AppleVisionBackend(OCRBackend):
         )
 
 
-def _normalize_bbox(box: BBox, shape: tuple[int, int, int]) -> tuple[int, int, int, int]:
-    height, width = shape[:2]
-    x1 = max(0, min(int(box[0]), width - 1))
-    y1 = max(0, min(int(box[1]), height - 1))
-    x2 = max(x1 + 1, min(int(box[2]), width))
-    y2 = max(y1 + 1, min(int(box[3]), height))
-    return x1, y1, x2, y2
-
-
 __all__ = ["AppleVisionBackend"]
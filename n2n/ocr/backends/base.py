@@ -39,12 +39,17 @@ class OCRResult:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class OCRConfig:
+    """Immutable so shared module-level configs stay safe to reuse and the
+    cached Tesseract config-string lookup keyed on their fields stays valid."""
+
     psm: int = 6
     lang: str = "eng"
     whitelist_digits: bool = False
     extra_whitelist: str = ""
+    # Stop the combo pipeline once a backend reaches this confidence.
+    accept_threshold: float = 0.9
 
 
 class OCRBackend(Protocol):
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import importlib.util
+import threading
 import time
 from typing import List, Tuple
 
-import cv2
 import numpy as np
 
+from n2n.ocr.backends._bbox import normalize_bbox
 from n2n.ocr.backends.base import (
     BBox,
     BackendUnavailable,
@@ -16,17 +18,17 @@ from n2n.ocr.backends.base import (
 )
 
 _EASY_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+_KEY_LOCKS: dict = {}
 
 
 class EasyOCRBackend(OCRBackend):
     name = "easyocr"
 
     def is_available(self) -> bool:
-        try:
-            import easyocr  # noqa: F401
-        except Exception:
-            return False
-        return True
+        # find_spec avoids executing the easyocr package init (torch, PIL, ...)
+        # just to probe availability.
+        return importlib.util.find_spec("easyocr") is not None
 
     def _client(self, lang: str):
         try:
@@ -35,12 +37,20 @@ class EasyOCRBackend(OCRBackend):
             raise BackendUnavailable(f"EasyOCR not installed: {exc}") from exc
         languages = [lang or "en"]
         key = tuple(languages)
-        if key not in _EASY_CACHE:
-            _EASY_CACHE[key] = easyocr.Reader(languages, gpu=False)
-        return _EASY_CACHE[key]
+        reader = _EASY_CACHE.get(key)
+        if reader is not None:
+            return reader
+        # Per-key lock so concurrent callers pay the multi-second Reader init
+        # exactly once instead of each loading their own copy.
+        with _CACHE_LOCK:
+            key_lock = _KEY_LOCKS.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in _EASY_CACHE:
+                _EASY_CACHE[key] = easyocr.Reader(languages, gpu=False)
+            return _EASY_CACHE[key]
 
     def ocr_roi(self, image: np.ndarray, roi_bbox: BBox, config: OCRConfig) -> OCRResult:
-        x1, y1, x2, y2 = _normalize_bbox(roi_bbox, image.shape)
+        x1, y1, x2, y2 = normalize_bbox(roi_bbox, image.shape)
         roi = image[y1:y2, x1:x2]
         if roi.size == 0:
             return OCRResult(text="", avg_conf=0.0, words=[], engine=self.name, elapsed_ms=0.0)
@@ -78,13 +88,4 @@ class EasyOCRBackend(OCRBackend):
         )
 
 
-def _normalize_bbox(box: BBox, shape: Tuple[int, int, int]) -> Tuple[int, int, int, int]:
-    height, width = shape[:2]
-    x1 = max(0, min(int(box[0]), width - 1))
-    y1 = max(0, min(int(box[1]), height - 1))
-    x2 = max(x1 + 1, min(int(box[2]), width))
-    y2 = max(y1 + 1, min(int(box[3]), height))
-    return x1, y1, x2, y2
-
-
 __all__ = ["EasyOCRBackend"]
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import importlib.util
+import threading
 import time
-from typing import List, Tuple
+from typing import List
 
-import cv2
 import numpy as np
 
+from n2n.ocr.backends._bbox import normalize_bbox
 from n2n.ocr.backends.base import (
     BBox,
     BackendUnavailable,
@@ -16,17 +18,17 @@ from n2n.ocr.backends.base import (
 )
 
 _PADDLE_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+_KEY_LOCKS: dict = {}
 
 
 class PaddleBackend(OCRBackend):
     name = "paddleocr"
 
     def is_available(self) -> bool:
-        try:
-            from paddleocr import PaddleOCR  # noqa: F401
-        except Exception:
-            return False
-        return True
+        # find_spec avoids executing the paddleocr package init just to probe
+        # availability.
+        return importlib.util.find_spec("paddleocr") is not None
 
     def _client(self, lang: str):
         try:
@@ -34,12 +36,20 @@ class PaddleBackend(OCRBackend):
         except Exception as exc:
             raise BackendUnavailable(f"PaddleOCR not installed: {exc}") from exc
         key = lang or "en"
-        if key not in _PADDLE_CACHE:
-            _PADDLE_CACHE[key] = PaddleOCR(lang=key, show_log=False, det=False, use_angle_cls=False)
-        return _PADDLE_CACHE[key]
+        client = _PADDLE_CACHE.get(key)
+        if client is not None:
+            return client
+        # Per-key lock so concurrent callers pay the heavy PaddleOCR init
+        # exactly once instead of each loading their own copy.
+        with _CACHE_LOCK:
+            key_lock = _KEY_LOCKS.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in _PADDLE_CACHE:
+                _PADDLE_CACHE[key] = PaddleOCR(lang=key, show_log=False, det=False, use_angle_cls=False)
+            return _PADDLE_CACHE[key]
 
     def ocr_roi(self, image: np.ndarray, roi_bbox: BBox, config: OCRConfig) -> OCRResult:
-        x1, y1, x2, y2 = _normalize_bbox(roi_bbox, image.shape)
+        x1, y1, x2, y2 = normalize_bbox(roi_bbox, image.shape)
         roi = image[y1:y2, x1:x2]
         if roi.size == 0:
             return OCRResult(text="", avg_conf=0.0, words=[], engine=self.name, elapsed_ms=0.0)
@@ -80,13 +90,4 @@ class PaddleBackend(OCRBackend):
         )
 
 
-def _normalize_bbox(box: BBox, shape: Tuple[int, int, int]) -> Tuple[int, int, int, int]:
-    height, width = shape[:2]
-    x1 = max(0, min(int(box[0]), width - 1))
-    y1 = max(0, min(int(box[1]), height - 1))
-    x2 = max(x1 + 1, min(int(box[2]), width))
-    y2 = max(y1 + 1, min(int(box[3]), height))
-    return x1, y1, x2, y2
-
-
 __all__ = ["PaddleBackend"]
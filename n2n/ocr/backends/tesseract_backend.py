@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import time
 from typing import List, Tuple
 
@@ -8,6 +9,8 @@ import numpy as np
 import pytesseract
 from pytesseract import Output
 
+from n2n.ocr.backends._bbox import normalize_bbox
+from n2n.ocr.backends._buffers import get_buf, release_buf
 from n2n.ocr.backends.base import (
     BBox,
     OCRBackend,
@@ -24,23 +27,25 @@ class TesseractBackend(OCRBackend):
         return True
 
     def ocr_roi(self, image: np.ndarray, roi_bbox: BBox, config: OCRConfig) -> OCRResult:
-        x1, y1, x2, y2 = _normalize_bbox(roi_bbox, image.shape)
+        x1, y1, x2, y2 = normalize_bbox(roi_bbox, image.shape)
         roi = image[y1:y2, x1:x2]
         if roi.size == 0:
             return OCRResult(text="", avg_conf=0.0, words=[], engine=self.name, elapsed_ms=0.0)
-        gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY) if roi.ndim == 3 else roi
-        cfg_parts = [f"--psm {config.psm}"]
-        if config.lang:
-            cfg_parts.append(f"-l {config.lang}")
-        whitelist = ""
-        if config.whitelist_digits:
-            whitelist = "0123456789"
-        if config.extra_whitelist:
-            whitelist += config.extra_whitelist
-        if whitelist:
-            cfg_parts.append(f'-c tessedit_char_whitelist="{whitelist}"')
+        pooled = None
+        if roi.ndim == 3:
+            pooled = get_buf(roi.shape[:2])
+            gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY, dst=pooled)
+        else:
+            gray = roi
+        cfg_string = _tesseract_cfg_string(
+            config.psm, config.lang, config.whitelist_digits, config.extra_whitelist
+        )
         t0 = time.perf_counter()
-        data = pytesseract.image_to_data(gray, output_type=Output.DICT, config=" ".join(cfg_parts))
+        try:
+            data = pytesseract.image_to_data(gray, output_type=Output.DICT, config=cfg_string)
+        finally:
+            if pooled is not None:
+                release_buf(pooled)
         elapsed = (time.perf_counter() - t0) * 1000.0
         words: List[OCRWord] = []
         confidences: List[float] = []
@@ -77,13 +82,19 @@ class TesseractBackend(OCRBackend):
         )
 
 
-def _normalize_bbox(box: BBox, shape: Tuple[int, int, int]) -> Tuple[int, int, int, int]:
-    height, width = shape[:2]
-    x1 = max(0, min(int(box[0]), width - 1))
-    y1 = max(0, min(int(box[1]), height - 1))
-    x2 = max(x1 + 1, min(int(box[2]), width))
-    y2 = max(y1 + 1, min(int(box[3]), height))
-    return x1, y1, x2, y2
+@functools.lru_cache(maxsize=128)
+def _tesseract_cfg_string(psm: int, lang: str, whitelist_digits: bool, extra_whitelist: str) -> str:
+    cfg_parts = [f"--psm {psm}"]
+    if lang:
+        cfg_parts.append(f"-l {lang}")
+    whitelist = ""
+    if whitelist_digits:
+        whitelist = "0123456789"
+    if extra_whitelist:
+        whitelist += extra_whitelist
+    if whitelist:
+        cfg_parts.append(f'-c tessedit_char_whitelist="{whitelist}"')
+    return " ".join(cfg_parts)
 
 
 __all__ = ["TesseractBackend"]
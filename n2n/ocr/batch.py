@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from n2n.ocr.backends.base import BBox, OCRConfig, OCRResult
+
+OCRTask = Tuple[np.ndarray, BBox, OCRConfig, str]
+
+_WORKER_ENV = {
+    "OMP_NUM_THREADS": "1",
+    "MKL_NUM_THREADS": "1",
+}
+
+
+def _init_worker(slot_counter) -> None:
+    # Pin intra-op threading to one before any heavy backend import so that
+    # N workers scale with cores instead of oversubscribing them.
+    for key, value in _WORKER_ENV.items():
+        os.environ.setdefault(key, value)
+    try:  # pragma: no cover - torch is pulled in via easyocr/ultralytics
+        import torch
+
+        torch.set_num_threads(1)
+    except Exception:
+        pass
+    try:  # pragma: no cover - psutil affinity pinning is best-effort
+        import psutil
+
+        with slot_counter.get_lock():
+            slot = slot_counter.value
+            slot_counter.value += 1
+        proc = psutil.Process()
+        cpus = proc.cpu_affinity()
+        if cpus:
+            proc.cpu_affinity([cpus[slot % len(cpus)]])
+    except Exception:
+        pass
+
+
+def _ocr_task(task: OCRTask) -> Tuple[Sequence[OCRResult], List[dict]]:
+    from n2n.ocr.registry import run_ocr_backends
+
+    image, roi_bbox, config, mode = task
+    return run_ocr_backends(image, roi_bbox, config, mode)
+
+
+def run_ocr_batch(
+    tasks: Sequence[OCRTask],
+    processes: int | None = None,
+) -> List[Tuple[Sequence[OCRResult], List[dict]]]:
+    """Run OCR tasks across a pool of backend-pinned worker processes.
+
+    Each task is ``(image, roi_bbox, config, mode)`` as accepted by
+    ``run_ocr_backends``; results come back in task order. Backend clients are
+    cached per worker, so the cold model load is paid once per process.
+    """
+    if not tasks:
+        return []
+    if processes is None:
+        processes = min(len(tasks), os.cpu_count() or 1)
+    if processes <= 1:
+        return [_ocr_task(task) for task in tasks]
+    ctx = multiprocessing.get_context("spawn")
+    slot_counter = ctx.Value("i", 0)
+    with ctx.Pool(processes=processes, initializer=_init_worker, initargs=(slot_counter,)) as pool:
+        return pool.map(_ocr_task, tasks)
+
+
+__all__ = ["OCRTask", "run_ocr_batch"]
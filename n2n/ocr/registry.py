@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Sequence, Tuple
 
 import numpy as np
@@ -29,6 +31,15 @@ _FACTORIES: Dict[str, callable] = {
 
 _VALID_MODES = {"auto", "combo", "tesseract", "apple", "paddle", "easy"}
 
+# Availability never changes within a process; cache per factory so a missing
+# Paddle/EasyOCR install is probed exactly once instead of on every call.
+_AVAIL_CACHE: Dict[object, bool] = {}
+
+# Backend objects are stateless wrappers — model/reader state lives in
+# per-module caches behind locks — so one instance per factory can serve
+# every call, including the threaded batch path.
+_INSTANCE_CACHE: Dict[object, OCRBackend] = {}
+
 
 def resolve_backend_mode(cli_value: str | None) -> str:
     env_mode = os.getenv("N2N_OCR_BACKEND")
@@ -36,32 +47,51 @@ def resolve_backend_mode(cli_value: str | None) -> str:
     return mode if mode in _VALID_MODES else "auto"
 
 
-def _sequence_for_mode(mode: str) -> List[str]:
+def _sequence_for_mode(mode: str, config: OCRConfig | None = None) -> List[str]:
     if mode == "tesseract":
         return ["tesseract"]
     if mode == "apple":
         return ["apple"]
-    if mode == "paddle":
-        return ["paddle"]
     if mode == "easy":
         return ["easy"]
+    if mode == "paddle":
+        return ["paddle"]
+    # Adaptive auto/combo routing: EasyOCR reads digit strings better while
+    # Tesseract is stronger on alphabetic text, so lead with the engine that
+    # matches the ROI's whitelist hint.
+    if config is not None:
+        if config.whitelist_digits and not config.extra_whitelist:
+            return ["easy", "apple", "tesseract"]
+        if not config.whitelist_digits and not config.extra_whitelist:
+            return ["tesseract", "apple", "paddle"]
     # default/auto/combo pipeline: Apple Vision -> PaddleOCR -> Tesseract
     order: List[str] = ["apple", "paddle", "tesseract"]
     return order
 
 
-def get_backends_for_mode(mode: str) -> List[OCRBackend]:
-    order = _sequence_for_mode(mode)
+def get_backends_for_mode(mode: str, config: OCRConfig | None = None) -> List[OCRBackend]:
+    order = _sequence_for_mode(mode, config)
     backends: List[OCRBackend] = []
     for name in order:
         factory = _FACTORIES.get(name)
         if not factory:
             continue
-        backend = factory()
-        if backend.is_available():
+        available = _AVAIL_CACHE.get(factory)
+        if available is False:
+            continue
+        backend = _INSTANCE_CACHE.get(factory)
+        if backend is None:
+            backend = _INSTANCE_CACHE[factory] = factory()
+        if available is None:
+            available = backend.is_available()
+            _AVAIL_CACHE[factory] = available
+        if available:
             backends.append(backend)
     if not backends:
-        backends.append(TesseractBackend())
+        fallback = _INSTANCE_CACHE.get(TesseractBackend)
+        if fallback is None:
+            fallback = _INSTANCE_CACHE[TesseractBackend] = TesseractBackend()
+        backends.append(fallback)
     return backends
 
 
@@ -73,7 +103,7 @@ def run_ocr_backends(
 ) -> Tuple[Sequence[OCRResult], List[dict]]:
     attempts: List[dict] = []
     results: List[OCRResult] = []
-    for backend in get_backends_for_mode(mode):
+    for backend in get_backends_for_mode(mode, config):
         start = time.perf_counter()
         try:
             result = backend.ocr_roi(image, roi_bbox, config)
@@ -87,6 +117,10 @@ def run_ocr_backends(
             }
             attempts.append(attempt)
             results.append(result)
+            accept_threshold = getattr(config, "accept_threshold", 0.9)
+            if result.avg_conf >= accept_threshold and (result.text or "").strip():
+                attempt["short_circuited"] = True
+                break
         except BackendUnavailable as exc:
             attempts.append(
                 {
@@ -114,6 +148,50 @@ def run_ocr_backends(
     return results, attempts
 
 
+OcrRequest = Tuple[np.ndarray, BBox, OCRConfig, str]
+
+
+def run_ocr_backends_batch(
+    requests: Sequence[OcrRequest],
+    max_workers: int | None = None,
+) -> List[Tuple[Sequence[OCRResult], List[dict]]]:
+    """Run many (image, roi_bbox, config, mode) requests in one call.
+
+    ROIs are dispatched across a thread pool — tesseract and PyMuPDF release
+    the GIL during the heavy work — and results come back in request order,
+    amortizing per-call setup across a whole page batch.
+    """
+    if not requests:
+        return []
+    if max_workers is None:
+        max_workers = min(len(requests), os.cpu_count() or 1)
+    if len(requests) == 1 or max_workers <= 1:
+        return [run_ocr_backends(*request) for request in requests]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda request: run_ocr_backends(*request), requests))
+
+
+async def run_ocr_backends_async(
+    image: np.ndarray,
+    roi_bbox: BBox,
+    config: OCRConfig,
+    mode: str,
+    *,
+    semaphore: asyncio.Semaphore | None = None,
+) -> Tuple[Sequence[OCRResult], List[dict]]:
+    """Async wrapper around run_ocr_backends for event-loop pipelines.
+
+    OCR runs on the loop's default executor so callers can overlap it with
+    I/O; pass a shared ``semaphore`` to bound how many OCR calls are in
+    flight at once.
+    """
+    loop = asyncio.get_running_loop()
+    if semaphore is None:
+        return await loop.run_in_executor(None, run_ocr_backends, image, roi_bbox, config, mode)
+    async with semaphore:
+        return await loop.run_in_executor(None, run_ocr_backends, image, roi_bbox, config, mode)
+
+
 __all__ = [
     "BackendUnavailable",
     "OCRConfig",
@@ -122,4 +200,6 @@ __all__ = [
     "resolve_backend_mode",
     "get_backends_for_mode",
     "run_ocr_backends",
+    "run_ocr_backends_async",
+    "run_ocr_backends_batch",
 ]
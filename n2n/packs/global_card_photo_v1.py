@@ -1,21 +1,31 @@
 from __future__ import annotations
 
-import json
+import queue
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Sequence, Tuple
+from typing import Dict, Iterator, List, Sequence, Tuple
 
 import cv2
+import numpy as np
+
+try:  # pragma: no cover - numba is an optional accelerator
+    from numba import njit
+except Exception:  # pragma: no cover
+    njit = None
 
 from n2n.models import DecisionReason, DetectionResult, TextSpan
 from n2n.packs.photo_common import (
     ArtifactPaths,
+    append_jsonl,
     build_report,
     load_page_contexts,
     render_pdf_to_image,
-    spans_to_payload,
     write_report,
+    write_spans_ndjson,
 )
 from n2n.packs.policy import Decision, PolicyConfig
 from n2n.ocr.backends.base import OCRConfig, OCRResult
@@ -23,7 +33,13 @@ from n2n.ocr.registry import resolve_backend_mode, run_ocr_backends
 from n2n.primitives.card_expiry import build_detection as build_expiry_detection
 from n2n.primitives.card_expiry import parse_expiry_from_text
 from n2n.primitives.card_pan import find_pan_candidates_from_roi_text
-from n2n.render.pdf_render import RenderBox, render_highlight_from_boxes, render_redact_from_boxes
+from n2n.render.pdf_render import (
+    RenderBox,
+    RenderBoxBatch,
+    render_highlight_from_boxes,
+    render_redact_from_boxes,
+)
+from n2n.vision.ocr_roi import ocr_rois_batch
 from n2n.vision.pan_visual_heuristic import detect_visual_pan_suspicion
 from n2n.vision.preprocess import (
     PreprocessOutput,
@@ -43,11 +59,12 @@ REASONS = {
     "OCCLUSION": "Potential occlusion or fingers detected.",
     "PAN_REMAINS": "PAN still detected after redaction.",
 }
+_DIGIT_RUN = re.compile(r"\d{2,}")
 PAN_OCR_CONFIG = OCRConfig(psm=7, lang="eng", whitelist_digits=True)
 EXPIRY_OCR_CONFIG = OCRConfig(psm=7, lang="eng", whitelist_digits=True, extra_whitelist="/")
 
 
-@dataclass
+@dataclass(slots=True)
 class RoiOcrResult:
     page: int
     label: str
@@ -61,6 +78,24 @@ class RoiOcrResult:
 
 
 @dataclass
+class _PreppedPage:
+    ctx: object
+    candidate_bbox: Tuple[int, int, int, int] | None
+    candidate_source: str
+    preprocess: PreprocessOutput
+    pan_roi: Tuple[float, float, float, float]
+    expiry_roi: Tuple[float, float, float, float]
+    roi_image: object
+
+
+@dataclass
+class _OcredPage:
+    prepped: _PreppedPage
+    pan_ocr: RoiOcrResult
+    expiry_ocr: RoiOcrResult
+
+
+@dataclass(slots=True)
 class PackState:
     detections: List[DetectionResult] = field(default_factory=list)
     highlight_boxes: List[RenderBox] = field(default_factory=list)
@@ -89,7 +124,7 @@ def run_pack(
         "input": input_trace,
         "vision": vision_trace,
         "preprocess": [],
-        "ocr": [],
+        "trace_jsonl": str(artifacts.trace_jsonl_path()),
         "validators": {},
         "ocr_backend_mode": backend_mode,
     }
@@ -97,136 +132,172 @@ def run_pack(
     used_engines: set[str] = set()
     card_candidate_present = False
 
-    for ctx in contexts:
-        page_idx = ctx.page.index
-        candidate_bbox, candidate_source = _resolve_card_candidate(ctx.boxes, ctx.image)
-        if candidate_bbox:
-            card_candidate_present = True
-        preprocess = preprocess_document_region(ctx.image, candidate_bbox)
-        prep_trace = {"page": page_idx, "card_candidate_source": candidate_source}
-        prep_trace.update(preprocess.trace)
-        trace["preprocess"].append(prep_trace)
-
-        pan_roi = _resolve_pan_roi(preprocess, ctx.boxes)
-        expiry_roi = _resolve_expiry_roi(preprocess, ctx.boxes)
-        pan_ocr = _run_roi_ocr(preprocess, ctx, pan_roi, "PAN ROI", PAN_OCR_CONFIG, backend_mode, prefer_digits=True)
-        expiry_ocr = _run_roi_ocr(preprocess, ctx, expiry_roi, "EXPIRY ROI", EXPIRY_OCR_CONFIG, backend_mode)
-        used_engines.update([pan_ocr.engine, expiry_ocr.engine])
-
-        trace["ocr"].append(
-            {
-                "page": page_idx,
-                "pan": _trace_entry(pan_ocr),
-                "expiry": _trace_entry(expiry_ocr),
-                "attempts": {
-                    "pan": pan_ocr.attempts,
-                    "expiry": expiry_ocr.attempts,
-                },
-            }
-        )
-        state.ocr_spans.extend(pan_ocr.spans)
-        state.ocr_spans.extend(expiry_ocr.spans)
-        state.ocr_records.extend([pan_ocr, expiry_ocr])
-
-        roi_image = _extract_roi(ctx.image, candidate_bbox)
-        visual = detect_visual_pan_suspicion(roi_image)
-        if visual:
-            bbox, visual_trace = visual
-            offset_x = candidate_bbox[0] if candidate_bbox else 0
-            offset_y = candidate_bbox[1] if candidate_bbox else 0
-            adjusted_bbox = (
-                bbox[0] + offset_x,
-                bbox[1] + offset_y,
-                bbox[2] + offset_x,
-                bbox[3] + offset_y,
+    # Bind the page-loop callables once up front: each iteration resolved
+    # these through the module dict (several times per detection for the
+    # box builders). Binding at entry also keeps the patch seam — tests
+    # swap the module attributes before calling run_pack.
+    write_event = append_jsonl
+    trace_entry = _trace_entry
+    find_pans = find_pan_candidates_from_roi_text
+    detect_visual = detect_visual_pan_suspicion
+    parse_expiry = parse_expiry_from_text
+    render_box = RenderBox
+    add_detection = state.detections.append
+    add_highlight = state.highlight_boxes.append
+    add_redact = state.redact_boxes.append
+
+    # Full per-page preprocess/OCR events stream to a JSONL sidecar; only the
+    # quality fields _decide reads stay in the report trace, keeping working
+    # memory flat on many-page inputs.
+    trace_handle = artifacts.trace_jsonl_path().open("wb")
+    try:
+        for ocred in _run_pipeline(contexts, backend_mode):
+            ctx = ocred.prepped.ctx
+            page_idx = ctx.page.index
+            candidate_bbox = ocred.prepped.candidate_bbox
+            if candidate_bbox:
+                card_candidate_present = True
+            preprocess = ocred.prepped.preprocess
+            prep_trace = {"page": page_idx, "card_candidate_source": ocred.prepped.candidate_source}
+            prep_trace.update(preprocess.trace)
+            write_event(trace_handle, {"type": "preprocess", **prep_trace})
+            trace["preprocess"].append(
+                {
+                    "page": page_idx,
+                    "blur_score": prep_trace.get("blur_score", 0.0),
+                    "quality": {
+                        "occlusion_suspected": bool(
+                            prep_trace.get("quality", {}).get("occlusion_suspected")
+                        )
+                    },
+                }
             )
-            visual_trace.setdefault("visual_pan", {})["roi_offset"] = [offset_x, offset_y]
-            trace.setdefault("visual_pan", []).append(visual_trace)
-            det = DetectionResult(
-                field_id="card_pan",
-                text="PAN_SUSPECT_VISUAL",
-                raw="PAN_SUSPECT_VISUAL",
-                bbox=adjusted_bbox,
-                page=page_idx,
-                source="visual",
-                validators=["PAN_SUSPECT_VISUAL"],
-                severity="suspicion",
+
+            pan_ocr = ocred.pan_ocr
+            expiry_ocr = ocred.expiry_ocr
+            used_engines.update([pan_ocr.engine, expiry_ocr.engine])
+
+            write_event(
+                trace_handle,
+                {
+                    "type": "ocr",
+                    "page": page_idx,
+                    "pan": trace_entry(pan_ocr),
+                    "expiry": trace_entry(expiry_ocr),
+                    "attempts": {
+                        "pan": pan_ocr.attempts,
+                        "expiry": expiry_ocr.attempts,
+                    },
+                },
             )
-            state.detections.append(det)
-            visual_box = RenderBox(
+            state.ocr_spans.extend(chain(pan_ocr.spans, expiry_ocr.spans))
+            state.ocr_records.append(pan_ocr)
+            state.ocr_records.append(expiry_ocr)
+
+            pan_dets = find_pans(
+                pan_ocr.text,
+                pan_ocr.stats,
+                pan_ocr.roi_page,
                 page=page_idx,
-                bbox=adjusted_bbox,
-                label="PAN VISUAL",
-                color=(0.9, 0.3, 0.1),
-                page_scale=ctx.page.scale,
             )
-            state.highlight_boxes.append(visual_box)
-            state.suggested_boxes.append(visual_box)
-            state.suggested_payload.append(
-                {"page": page_idx, "bbox": [round(v, 2) for v in adjusted_bbox], "label": "PAN VISUAL"}
-            )
-
-        pan_dets = find_pan_candidates_from_roi_text(
-            pan_ocr.text,
-            pan_ocr.stats,
-            pan_ocr.roi_page,
-            page=page_idx,
-        )
-        for det in pan_dets:
-            state.detections.append(det)
-            state.highlight_boxes.append(
-                RenderBox(
-                    page=det.page,
-                    bbox=det.bbox,
-                    label=f"{det.field_id}:{det.severity}",
-                    color=(0.0, 0.8, 0.0) if det.severity == "hit" else (0.8, 0.5, 0.0),
-                    page_scale=ctx.page.scale,
+            for det in pan_dets:
+                add_detection(det)
+                add_highlight(
+                    render_box(
+                        page=det.page,
+                        bbox=det.bbox,
+                        label=f"{det.field_id}:{det.severity}",
+                        color=(0.0, 0.8, 0.0) if det.severity == "hit" else (0.8, 0.5, 0.0),
+                        page_scale=ctx.page.scale,
+                    )
                 )
-            )
-            if det.severity == "hit":
-                state.redact_boxes.append(
-                    RenderBox(
+                if det.severity == "hit":
+                    add_redact(
+                        render_box(
+                            page=det.page,
+                            bbox=det.bbox,
+                            label="PAN",
+                            color=(0.0, 0.0, 0.0),
+                            page_scale=ctx.page.scale,
+                        )
+                    )
+
+            # The visual heuristic only matters when OCR did not already confirm
+            # a PAN on this page, so skip the vision pass on confirmed pages.
+            if not any(det.severity == "hit" for det in pan_dets):
+                roi_image = ocred.prepped.roi_image
+                visual = detect_visual(roi_image)
+                if visual:
+                    bbox, visual_trace = visual
+                    offset_x = candidate_bbox[0] if candidate_bbox else 0
+                    offset_y = candidate_bbox[1] if candidate_bbox else 0
+                    adjusted_bbox = (
+                        bbox[0] + offset_x,
+                        bbox[1] + offset_y,
+                        bbox[2] + offset_x,
+                        bbox[3] + offset_y,
+                    )
+                    visual_trace.setdefault("visual_pan", {})["roi_offset"] = [offset_x, offset_y]
+                    trace.setdefault("visual_pan", []).append(visual_trace)
+                    det = DetectionResult(
+                        field_id="card_pan",
+                        text="PAN_SUSPECT_VISUAL",
+                        raw="PAN_SUSPECT_VISUAL",
+                        bbox=adjusted_bbox,
+                        page=page_idx,
+                        source="visual",
+                        validators=["PAN_SUSPECT_VISUAL"],
+                        severity="suspicion",
+                    )
+                    add_detection(det)
+                    visual_box = render_box(
+                        page=page_idx,
+                        bbox=adjusted_bbox,
+                        label="PAN VISUAL",
+                        color=(0.9, 0.3, 0.1),
+                        page_scale=ctx.page.scale,
+                    )
+                    add_highlight(visual_box)
+                    state.suggested_boxes.append(visual_box)
+                    state.suggested_payload.append(
+                        {"page": page_idx, "bbox": _round_bbox(adjusted_bbox), "label": "PAN VISUAL"}
+                    )
+
+            expiry_detection = parse_expiry(expiry_ocr.text)
+            if expiry_detection:
+                det = build_expiry_detection("card_expiry", expiry_detection, expiry_ocr.roi_page, page_idx)
+                add_detection(det)
+                add_highlight(
+                    render_box(
                         page=det.page,
                         bbox=det.bbox,
-                        label="PAN",
-                        color=(0.0, 0.0, 0.0),
+                        label="EXPIRY",
+                        color=(0.2, 0.5, 0.9),
                         page_scale=ctx.page.scale,
                     )
                 )
 
-        expiry_detection = parse_expiry_from_text(expiry_ocr.text)
-        if expiry_detection:
-            det = build_expiry_detection("card_expiry", expiry_detection, expiry_ocr.roi_page, page_idx)
-            state.detections.append(det)
-            state.highlight_boxes.append(
-                RenderBox(
-                    page=det.page,
-                    bbox=det.bbox,
-                    label="EXPIRY",
-                    color=(0.2, 0.5, 0.9),
+            # Always highlight ROI regions for transparency
+            add_highlight(
+                render_box(
+                    page=page_idx,
+                    bbox=pan_ocr.roi_page,
+                    label="PAN ROI",
+                    color=(0.9, 0.2, 0.2),
                     page_scale=ctx.page.scale,
                 )
             )
-
-        # Always highlight ROI regions for transparency
-        state.highlight_boxes.append(
-            RenderBox(
-                page=page_idx,
-                bbox=pan_ocr.roi_page,
-                label="PAN ROI",
-                color=(0.9, 0.2, 0.2),
-                page_scale=ctx.page.scale,
-            )
-        )
-        state.highlight_boxes.append(
-            RenderBox(
-                page=page_idx,
-                bbox=expiry_ocr.roi_page,
-                label="EXPIRY ROI",
-                color=(0.2, 0.6, 0.8),
-                page_scale=ctx.page.scale,
+            add_highlight(
+                render_box(
+                    page=page_idx,
+                    bbox=expiry_ocr.roi_page,
+                    label="EXPIRY ROI",
+                    color=(0.2, 0.6, 0.8),
+                    page_scale=ctx.page.scale,
+                )
             )
-        )
+    finally:
+        trace_handle.close()
 
     decision, reasons = _decide(state, trace, card_candidate_present, policy)
     allow_suggestions = _allow_suggestions(state, decision)
@@ -243,7 +314,7 @@ def run_pack(
 
     highlight_path = render_highlight_from_boxes(
         input_path,
-        state.highlight_boxes,
+        RenderBoxBatch.from_boxes(state.highlight_boxes),
         artifacts.highlight_path(),
     )
     artifact_map["highlight_pdf"] = highlight_path
@@ -253,7 +324,7 @@ def run_pack(
     if decision == "CONFIRMED" and state.redact_boxes:
         redacted_path = render_redact_from_boxes(
             input_path,
-            state.redact_boxes,
+            RenderBoxBatch.from_boxes(state.redact_boxes),
             artifacts.redacted_path(),
         )
         artifact_map["redacted_pdf"] = redacted_path
@@ -266,7 +337,7 @@ def run_pack(
     elif decision == "REVIEW" and force_band_redact and allow_suggestions and state.suggested_boxes:
         redacted_path = render_redact_from_boxes(
             input_path,
-            state.suggested_boxes,
+            RenderBoxBatch.from_boxes(state.suggested_boxes),
             artifacts.redacted_path(),
         )
         artifact_map["redacted_pdf"] = redacted_path
@@ -290,15 +361,134 @@ def run_pack(
     return report.to_dict()
 
 
-def _select_card_box(boxes: Sequence[object]) -> object | None:
-    card_boxes = [box for box in boxes if box.label in {"card", "id_card"}]
-    if not card_boxes:
+def _run_pipeline(contexts: Sequence[object], backend_mode: str) -> Iterator[_OcredPage]:
+    """Overlap preprocess and OCR across pages with a two-queue pipeline.
+
+    Stage A (thread) preprocesses and resolves ROIs, stage B (thread) runs the
+    OCR backends, and the consumer — run_pack's main loop — keeps all state
+    mutation single-threaded. Bounded queues give backpressure; a ``None``
+    sentinel closes each stage and exceptions are re-raised in the consumer.
+    Every queue wait in the stages polls a stop flag, and the consumer sets
+    it in a ``finally``, so the threads always terminate — without that, a
+    stage error or an early generator close would leave the other stage
+    blocked on a full queue forever, leaking threads (and the page images
+    they hold) in long-lived processes like the API server.
+    """
+    q_prepped: queue.Queue = queue.Queue(maxsize=4)
+    q_ocred: queue.Queue = queue.Queue(maxsize=4)
+    stop = threading.Event()
+
+    def _put(q: queue.Queue, item) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(q: queue.Queue):
+        while not stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
         return None
-    return max(card_boxes, key=lambda b: b.conf)
 
+    def stage_preprocess() -> None:
+        try:
+            for ctx in contexts:
+                if stop.is_set():
+                    return
+                best_boxes = _best_boxes_by_label(ctx.boxes)
+                candidate_bbox, candidate_source = _resolve_card_candidate(best_boxes, ctx.image)
+                preprocess = _preprocess_cached(ctx.image, candidate_bbox)
+                delivered = _put(
+                    q_prepped,
+                    _PreppedPage(
+                        ctx=ctx,
+                        candidate_bbox=candidate_bbox,
+                        candidate_source=candidate_source,
+                        preprocess=preprocess,
+                        pan_roi=_resolve_pan_roi(preprocess, best_boxes),
+                        expiry_roi=_resolve_expiry_roi(preprocess, best_boxes),
+                        roi_image=_extract_roi(ctx.image, candidate_bbox),
+                    ),
+                )
+                if not delivered:
+                    return
+        except BaseException as exc:  # propagate to the consumer
+            _put(q_prepped, exc)
+        else:
+            _put(q_prepped, None)
+
+    def stage_ocr() -> None:
+        while True:
+            item = _get(q_prepped)
+            if item is None or isinstance(item, BaseException):
+                _put(q_ocred, item)
+                return
+            try:
+                pan_ocr = _run_roi_ocr(
+                    item.preprocess, item.ctx, item.pan_roi, "PAN ROI", PAN_OCR_CONFIG, backend_mode, prefer_digits=True
+                )
+                expiry_ocr = _run_roi_ocr(
+                    item.preprocess, item.ctx, item.expiry_roi, "EXPIRY ROI", EXPIRY_OCR_CONFIG, backend_mode
+                )
+            except BaseException as exc:
+                _put(q_ocred, exc)
+                return
+            if not _put(q_ocred, _OcredPage(prepped=item, pan_ocr=pan_ocr, expiry_ocr=expiry_ocr)):
+                return
+
+    threads = [
+        threading.Thread(target=stage_preprocess, name="card-pack-preprocess", daemon=True),
+        threading.Thread(target=stage_ocr, name="card-pack-ocr", daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        while True:
+            item = q_ocred.get()
+            if item is None:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # Reached on normal completion, on a re-raised stage error, and on
+        # generator close (consumer raised between yields): wake any stage
+        # parked on a queue and wait for both to exit.
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+_INTERESTING_LABELS = frozenset({"card", "id_card", "pan", "expiry"})
+
+
+def _best_boxes_by_label(boxes: Sequence[object]) -> Dict[str, object]:
+    """Single pass over detections keeping the max-conf box per label."""
+    best: Dict[str, object] = {}
+    for box in boxes:
+        if box.label not in _INTERESTING_LABELS:
+            continue
+        current = best.get(box.label)
+        if current is None or box.conf > current.conf:
+            best[box.label] = box
+    return best
 
-def _resolve_card_candidate(boxes: Sequence[object], image) -> Tuple[Tuple[int, int, int, int] | None, str]:
-    card_box = _select_card_box(boxes)
+
+def _select_card_box(best_boxes: Dict[str, object]) -> object | None:
+    card = best_boxes.get("card")
+    id_card = best_boxes.get("id_card")
+    if card and id_card:
+        return card if card.conf >= id_card.conf else id_card
+    return card or id_card
+
+
+def _resolve_card_candidate(best_boxes: Dict[str, object], image) -> Tuple[Tuple[int, int, int, int] | None, str]:
+    card_box = _select_card_box(best_boxes)
     if card_box:
         return tuple(map(int, card_box.as_tuple())), "detector"
     guessed = _guess_card_bbox(image)
@@ -310,46 +500,121 @@ def _resolve_card_candidate(boxes: Sequence[object], image) -> Tuple[Tuple[int,
     return (margin_w, margin_h, width - margin_w, height - margin_h), "fallback"
 
 
+def _polygon_area(points: np.ndarray) -> float:
+    # Shoelace formula over an (N, 2) float64 contour; jitted when numba is
+    # installed, plain numpy otherwise.
+    xs = points[:, 0]
+    ys = points[:, 1]
+    return 0.5 * abs(np.dot(xs, np.roll(ys, -1)) - np.dot(ys, np.roll(xs, -1)))
+
+
+if njit is not None:  # pragma: no cover - exercised only with numba installed
+    _polygon_area = njit(cache=True, nogil=True)(_polygon_area)
+
+
+_GUESS_MAX_EDGE = 512
+# Re-runs over the same loaded pages (e.g. retrying with another OCR
+# backend) hit identical image objects; memoize per live array. Entries
+# hold a reference to the source image so its id cannot be recycled for
+# a different page while the entry lives — shape/margin heuristics are
+# not usable as keys because rendered pages share both.
+_GUESS_CACHE: Dict[int, Tuple[object, Tuple[int, int, int, int] | None]] = {}
+_GUESS_CACHE_MAX = 8
+
+
 def _guess_card_bbox(image) -> Tuple[int, int, int, int] | None:
     if image is None or image.size == 0:
         return None
+    entry = _GUESS_CACHE.get(id(image))
+    if entry is not None and entry[0] is image:
+        return entry[1]
+    result = _guess_card_bbox_uncached(image)
+    if len(_GUESS_CACHE) >= _GUESS_CACHE_MAX:
+        _GUESS_CACHE.pop(next(iter(_GUESS_CACHE)))
+    _GUESS_CACHE[id(image)] = (image, result)
+    return result
+
+
+def _guess_card_bbox_uncached(image) -> Tuple[int, int, int, int] | None:
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    blur = cv2.GaussianBlur(gray, (5, 5), 0)
-    edges = cv2.Canny(blur, 30, 120)
-    contours, _ = cv2.findContours(edges, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
+    height, width = gray.shape[:2]
+    # Coarse card location only needs ~512px of resolution; downscaling makes
+    # the blur/Canny passes cheap and the bbox is rescaled afterwards.
+    scale = 1.0
+    longest = max(height, width)
+    if longest > _GUESS_MAX_EDGE:
+        scale = _GUESS_MAX_EDGE / float(longest)
+        gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    if cv2.ocl.haveOpenCL():
+        # Blur and Canny dispatch to OpenCL via UMat; findContours is
+        # CPU-only so the edge map comes back with .get().
+        blur = cv2.GaussianBlur(cv2.UMat(gray), (5, 5), 0)
+        edges = cv2.Canny(blur, 30, 120).get()
+    else:
+        blur = cv2.GaussianBlur(gray, (5, 5), 0)
+        edges = cv2.Canny(blur, 30, 120)
+    contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
     if not contours:
         return None
-    h, w = gray.shape[:2]
-    area_threshold = 0.2 * h * w
-    largest = max(contours, key=cv2.contourArea)
-    if cv2.contourArea(largest) < area_threshold:
+    small_h, small_w = gray.shape[:2]
+    area_threshold = 0.2 * small_h * small_w
+    areas = [_polygon_area(contour.reshape(-1, 2).astype(np.float64)) for contour in contours]
+    best_idx = int(np.argmax(areas))
+    if areas[best_idx] < area_threshold:
         return None
-    x, y, cw, ch = cv2.boundingRect(largest)
+    x, y, cw, ch = cv2.boundingRect(contours[best_idx])
+    if scale != 1.0:
+        inv = 1.0 / scale
+        x, y, cw, ch = int(x * inv), int(y * inv), int(cw * inv), int(ch * inv)
     pad_w = int(cw * 0.03)
     pad_h = int(ch * 0.03)
     return (
         max(0, x - pad_w),
         max(0, y - pad_h),
-        min(w, x + cw + pad_w),
-        min(h, y + ch + pad_h),
+        min(width, x + cw + pad_w),
+        min(height, y + ch + pad_h),
     )
 
 
+# Re-runs over the same loaded pages (e.g. retrying with another OCR
+# backend) repeat the blur/quality/deskew work; memoize per live image
+# object. Entries hold a reference to the source array: id() alone is
+# not a safe key because CPython recycles the address for the next
+# same-shape allocation, which would hand a later document the previous
+# document's PreprocessOutput. The identity check on the hit path makes
+# a recycled-id lookup miss instead.
+_PREPROCESS_CACHE: Dict[tuple, Tuple[object, PreprocessOutput]] = {}
+_PREPROCESS_CACHE_MAX = 8
+
+
+def _preprocess_cached(image, candidate_bbox: Tuple[int, int, int, int] | None) -> PreprocessOutput:
+    key = (id(image), candidate_bbox)
+    entry = _PREPROCESS_CACHE.get(key)
+    if entry is not None and entry[0] is image:
+        return entry[1]
+    result = preprocess_document_region(image, candidate_bbox)
+    if len(_PREPROCESS_CACHE) >= _PREPROCESS_CACHE_MAX:
+        _PREPROCESS_CACHE.pop(next(iter(_PREPROCESS_CACHE)))
+    _PREPROCESS_CACHE[key] = (image, result)
+    return result
+
+
 def _extract_roi(image, bbox: Tuple[int, int, int, int] | None):
     if bbox is None:
         return image
-    x1, y1, x2, y2 = map(int, bbox)
-    x1 = max(0, min(x1, image.shape[1] - 1))
-    y1 = max(0, min(y1, image.shape[0] - 1))
-    x2 = max(x1 + 1, min(x2, image.shape[1]))
-    y2 = max(y1 + 1, min(y2, image.shape[0]))
+    height, width = image.shape[:2]
+    x1, y1, x2, y2 = int(bbox[0]), int(bbox[1]), int(bbox[2]), int(bbox[3])
+    x1 = 0 if x1 < 0 else (width - 1 if x1 >= width else x1)
+    y1 = 0 if y1 < 0 else (height - 1 if y1 >= height else y1)
+    x2 = x1 + 1 if x2 <= x1 else (width if x2 > width else x2)
+    y2 = y1 + 1 if y2 <= y1 else (height if y2 > height else y2)
+    # Plain slice: a view into the page image, no copy.
     return image[y1:y2, x1:x2]
 
 
-def _resolve_pan_roi(preprocess: PreprocessOutput, boxes: Sequence[object]) -> Tuple[float, float, float, float]:
-    candidates = [box for box in boxes if box.label == "pan"]
-    if candidates:
-        best = max(candidates, key=lambda b: b.conf)
+def _resolve_pan_roi(preprocess: PreprocessOutput, best_boxes: Dict[str, object]) -> Tuple[float, float, float, float]:
+    best = best_boxes.get("pan")
+    if best:
         return map_page_box_to_normalized(best.as_tuple(), preprocess)
     height, width = preprocess.image.shape[:2]
     band = int(height * 0.3)
@@ -358,10 +623,9 @@ def _resolve_pan_roi(preprocess: PreprocessOutput, boxes: Sequence[object]) -> T
     return (int(width * 0.08), y1, int(width * 0.92), y2)
 
 
-def _resolve_expiry_roi(preprocess: PreprocessOutput, boxes: Sequence[object]) -> Tuple[float, float, float, float]:
-    candidates = [box for box in boxes if box.label == "expiry"]
-    if candidates:
-        best = max(candidates, key=lambda b: b.conf)
+def _resolve_expiry_roi(preprocess: PreprocessOutput, best_boxes: Dict[str, object]) -> Tuple[float, float, float, float]:
+    best = best_boxes.get("expiry")
+    if best:
         return map_page_box_to_normalized(best.as_tuple(), preprocess)
     height, width = preprocess.image.shape[:2]
     return (int(width * 0.55), int(height * 0.6), int(width * 0.95), int(height * 0.92))
@@ -427,23 +691,29 @@ def _convert_words_to_page(
     return converted
 
 
+def _round_bbox(bbox: Sequence[float]) -> List[float]:
+    # One vectorized C call instead of four round() invocations.
+    return np.round(np.asarray(bbox, dtype=np.float64), 2).tolist()
+
+
 def _trace_entry(roi: RoiOcrResult) -> Dict[str, object]:
     return {
         "page": roi.page,
-        "bbox": [round(v, 2) for v in roi.roi_page],
+        "bbox": _round_bbox(roi.roi_page),
         "stats": roi.stats,
         "text_preview": _mask_digits(roi.text),
         "engine": roi.engine,
     }
 
-def _mask_digits(text: str) -> str:
-    def repl(match: re.Match[str]) -> str:
-        digits = match.group(0)
-        if len(digits) <= 4:
-            return "#" * len(digits)
-        return "#" * (len(digits) - 4) + digits[-4:]
+def _mask_digit_run(match: re.Match[str]) -> str:
+    digits = match.group(0)
+    if len(digits) <= 4:
+        return "#" * len(digits)
+    return "#" * (len(digits) - 4) + digits[-4:]
+
 
-    return re.sub(r"\d{2,}", repl, text or "")
+def _mask_digits(text: str) -> str:
+    return _DIGIT_RUN.sub(_mask_digit_run, text or "")
 
 
 def _select_best_result(results, prefer_digits: bool) -> OCRResult:
@@ -451,8 +721,7 @@ def _select_best_result(results, prefer_digits: bool) -> OCRResult:
         return OCRResult(text="", avg_conf=0.0, words=[], engine="none", elapsed_ms=0.0)
 
     def key(res: OCRResult):
-        digits = re.sub(r"[^0-9]", "", res.text or "")
-        digit_count = len(digits)
+        digit_count = sum(1 for ch in (res.text or "") if ch.isdigit())
         return (
             digit_count if prefer_digits else 0,
             res.avg_conf,
@@ -475,16 +744,25 @@ def _decide(
     card_candidate_present: bool,
     policy: PolicyConfig,
 ) -> Tuple[str, List[DecisionReason]]:
-    pan_hits = [
-        det for det in state.detections if det.field_id == "card_pan" and det.severity == "hit" and det.source != "visual"
-    ]
-    pan_suspects = [
-        det
-        for det in state.detections
-        if det.field_id == "card_pan" and det.severity == "suspicion" and det.source != "visual"
-    ]
-    visual_pan = [det for det in state.detections if det.field_id == "card_pan" and det.source == "visual"]
-    expiry_hits = [det for det in state.detections if det.field_id == "card_expiry"]
+    # One pass over detections instead of a comprehension per category.
+    pan_hits: List[DetectionResult] = []
+    pan_suspects: List[DetectionResult] = []
+    visual_pan: List[DetectionResult] = []
+    expiry_hits: List[DetectionResult] = []
+    ocr_pan_present = False
+    for det in state.detections:
+        if det.field_id == "card_pan":
+            if det.source == "visual":
+                visual_pan.append(det)
+                continue
+            if det.source == "roi_ocr":
+                ocr_pan_present = True
+            if det.severity == "hit":
+                pan_hits.append(det)
+            elif det.severity == "suspicion":
+                pan_suspects.append(det)
+        elif det.field_id == "card_expiry":
+            expiry_hits.append(det)
     occlusion_flags = [
         entry for entry in trace["preprocess"] if entry.get("quality", {}).get("occlusion_suspected")
     ]
@@ -505,7 +783,6 @@ def _decide(
         ]
 
     reasons: List[DecisionReason] = []
-    ocr_pan_present = any(det.field_id == "card_pan" and det.source == "roi_ocr" for det in state.detections)
     if visual_pan and not ocr_pan_present:
         reasons.append(DecisionReason(code="PAN_SUSPECT_VISUAL", description=REASONS["PAN_SUSPECT_VISUAL"]))
     if pan_suspects:
@@ -543,17 +820,36 @@ def _verify_redaction(
 ) -> Dict[str, int]:
     hits_remaining = 0
     checked = 0
-    page_cache: Dict[int, object] = {}
+    boxes_by_page: Dict[int, List[RenderBox]] = {}
     for box in boxes:
-        if box.page not in page_cache:
-            image = render_pdf_to_image(redacted_pdf, box.page, dpi=dpi)
-            page_cache[box.page] = image
-        image = page_cache[box.page]
-        text, stats, _ = ocr_roi(image, box.bbox, mode="pan_digits")
-        detections = find_pan_candidates_from_roi_text(text, stats, box.bbox, page=box.page)
-        if any(det.severity == "hit" for det in detections):
-            hits_remaining += 1
-        checked += 1
+        boxes_by_page.setdefault(box.page, []).append(box)
+    if not boxes_by_page:
+        return {"checked": 0, "hits_remaining": 0}
+    # Rasterization releases the GIL inside PyMuPDF, so rendering the unique
+    # pages concurrently overlaps the dominant cost of verification.
+    unique_pages = list(boxes_by_page)
+    # Grayscale up front: tesseract converts internally anyway, and a
+    # single-channel page cuts the stitched-canvas traffic to a third.
+    with ThreadPoolExecutor(max_workers=min(8, len(unique_pages))) as pool:
+        page_images = dict(
+            zip(
+                unique_pages,
+                pool.map(
+                    lambda page: cv2.cvtColor(
+                        render_pdf_to_image(redacted_pdf, page, dpi=dpi), cv2.COLOR_BGR2GRAY
+                    ),
+                    unique_pages,
+                ),
+            )
+        )
+    for page, page_boxes in boxes_by_page.items():
+        image = page_images[page]
+        results = ocr_rois_batch(image, [box.bbox for box in page_boxes], mode="pan_digits")
+        for box, (text, stats, _) in zip(page_boxes, results):
+            detections = find_pan_candidates_from_roi_text(text, stats, box.bbox, page=page)
+            if any(det.severity == "hit" for det in detections):
+                hits_remaining += 1
+            checked += 1
     return {"checked": checked, "hits_remaining": hits_remaining}
 
 
@@ -562,10 +858,10 @@ def _write_ocr_artifacts(
     roi_records: Sequence[RoiOcrResult],
     spans: Sequence[TextSpan],
 ) -> None:
-    text_lines = [record.text for record in roi_records if record.text]
-    artifacts.ocr_text_path().write_text("\n".join(text_lines), encoding="utf-8")
-    payload = spans_to_payload(spans)
-    artifacts.ocr_spans_path().write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    # Stream lines straight to disk rather than joining one big string.
+    with artifacts.ocr_text_path().open("w", encoding="utf-8") as handle:
+        handle.writelines(record.text + "\n" for record in roi_records if record.text)
+    write_spans_ndjson(spans, artifacts.ocr_spans_path())
 
 
 __all__ = ["run_pack", "PACK_ID"]
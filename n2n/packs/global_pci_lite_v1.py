@@ -1,13 +1,22 @@
 from __future__ import annotations
 
-import json
+import hashlib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 from n2n import ENGINE_VERSION
-from n2n.extract import extract_spans
+
+import fitz
+
+try:  # pragma: no cover - img2pdf is an optional accelerator
+    import img2pdf
+except ImportError:  # pragma: no cover
+    img2pdf = None
+
+from n2n.extract import extract_spans, extract_spans_regions
 from n2n.models import DecisionReason, DecisionReport, DetectionResult
+from n2n.packs.photo_common import write_json
 from n2n.primitives.card_pan import CardPanConfig, find_card_pans
 from n2n.render import render_highlight, render_redact
 from PIL import Image
@@ -132,7 +141,11 @@ def run_pack(input_pdf: Path, outdir: Path, **_: object) -> Dict[str, object]:
         redacted_path = render_redact(render_source, hits, artifacts.redacted_path())
         artifact_map["redacted_pdf"] = redacted_path
 
-        re_spans, _, re_stats = extract_spans(redacted_path, artifact_dir=outdir)
+        re_spans = _reextract_hit_regions(Path(redacted_path), hits)
+        if re_spans is None:
+            re_spans, _, re_stats = extract_spans(redacted_path, artifact_dir=outdir)
+        else:
+            re_stats = {"span_count": len(re_spans)}
         re_trace: Dict[str, object] = {}
         re_detections = find_card_pans(re_spans, CARD_PAN_CFG, trace=re_trace)
         trace["post_redaction"] = {
@@ -180,15 +193,46 @@ def run_pack(input_pdf: Path, outdir: Path, **_: object) -> Dict[str, object]:
 
 def _write_report(report: DecisionReport, path: Path) -> None:
     report.artifacts["report_json"] = str(path)
-    path.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+    write_json(report.to_dict(), path)
+
+
+def _reextract_hit_regions(redacted_pdf: Path, hits: List[DetectionResult]) -> List | None:
+    """Re-extract only the redacted hit regions when that is cheaper.
+
+    Returns None to request a full re-extract: when the redacted PDF cannot
+    be inspected, when the region OCR fails, or when the hits already cover
+    every page so a targeted pass would not save anything.
+    """
+    if redacted_pdf.suffix.lower() != ".pdf" or not redacted_pdf.exists():
+        return None
+    try:
+        # One document open covers both the page-count check and the region
+        # OCR; extract_spans_regions leaves a caller-owned doc open.
+        with fitz.open(str(redacted_pdf)) as doc:
+            hit_pages = {det.page for det in hits}
+            if len(hit_pages) >= len(doc):
+                return None
+            return extract_spans_regions(doc, [(det.page, det.bbox) for det in hits])
+    except Exception:
+        return None
 
 
 def _ensure_pdf_source(input_path: Path, outdir: Path) -> Path:
     if input_path.suffix.lower() == ".pdf":
         return input_path
-    converted = outdir / f"{input_path.stem}_source.pdf"
-    if converted.exists() and converted.stat().st_mtime >= input_path.stat().st_mtime:
+    # Content fingerprint in the filename lets repeat runs on the same bytes
+    # short-circuit without trusting mtimes.
+    digest = hashlib.sha1(input_path.read_bytes()).hexdigest()[:8]
+    converted = outdir / f"{input_path.stem}_{digest}_source.pdf"
+    if converted.exists():
         return converted
+    if img2pdf is not None:
+        try:
+            # Wraps the original JPEG/PNG stream losslessly, no re-encode.
+            converted.write_bytes(img2pdf.convert(str(input_path)))
+            return converted
+        except Exception:
+            pass  # e.g. alpha channels img2pdf refuses; use the PIL path
     image = Image.open(str(input_path))
     if image.mode not in ("RGB", "CMYK"):
         image = image.convert("RGB")
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
+import functools
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
 
 import cv2
 import fitz
 import numpy as np
 
+try:  # pragma: no cover - orjson is an optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from n2n import ENGINE_VERSION
 from n2n.io import PageImage, prepare_input_images
 from n2n.models import DecisionReason, DecisionReport, DetectionResult, TextSpan
 from n2n.render.pdf_render import RenderBox
-from n2n.vision.detect import Box, detect_objects, load_yolo_model
+from n2n.vision.detect import Box, detect_objects_batch, load_yolo_model
 
 
 @dataclass
@@ -34,7 +40,10 @@ class ArtifactPaths:
         return self.outdir / f"{self.input_path.stem}_ocr_text.txt"
 
     def ocr_spans_path(self) -> Path:
-        return self.outdir / f"{self.input_path.stem}_ocr_spans.json"
+        return self.outdir / f"{self.input_path.stem}_ocr_spans.ndjson"
+
+    def trace_jsonl_path(self) -> Path:
+        return self.outdir / f"{self.input_path.stem}_trace.jsonl"
 
 
 @dataclass
@@ -42,6 +51,16 @@ class PageContext:
     page: PageImage
     image: np.ndarray
     boxes: List[Box]
+    # SoA mirrors of boxes so per-label selection can use numpy masks
+    # instead of Python-level attribute walks.
+    labels: np.ndarray = field(init=False, repr=False)
+    confs: np.ndarray = field(init=False, repr=False)
+    bboxes: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.labels = np.array([box.label for box in self.boxes], dtype=object)
+        self.confs = np.array([box.conf for box in self.boxes], dtype=np.float32)
+        self.bboxes = np.array([box.as_tuple() for box in self.boxes], dtype=np.float32).reshape(-1, 4)
 
 
 
@@ -55,37 +74,51 @@ def load_page_contexts(
     contexts: List[PageContext] = []
     model, model_info = load_yolo_model(model_path)
     model_used = bool(model_info.get("model_used"))
+    images: List[np.ndarray] = []
     for page in pages:
-        image = cv2.imread(str(page.path))
+        # The render step keeps the decoded pixels on the PageImage; only
+        # fall back to re-reading the PNG when they are absent.
+        image = page.array if page.array is not None else cv2.imread(str(page.path))
         if image is None:
             raise RuntimeError(f"Failed to load rendered page image: {page.path}")
-        detections = detect_objects(image, model) if model else []
+        images.append(image)
+    # One batched model call for the whole document instead of per-page
+    # dispatch; ultralytics handles letterboxing mixed sizes internally.
+    # When the loader fell back (model_used False) there is nothing useful
+    # the model could return, so skip dispatch entirely.
+    if model is not None and model_used:
+        detections_per_page = detect_objects_batch(images, model)
+    else:
+        detections_per_page = [[] for _ in images]
+    for page, image, detections in zip(pages, images, detections_per_page):
         contexts.append(PageContext(page=page, image=image, boxes=detections))
     vision_trace = {
         "weights_path": str(model_path),
         "model_used": model_used,
         "model_reason": model_info.get("reason", ""),
-        "pages": [
-            {
-                "index": ctx.page.index,
-                "width": ctx.page.width,
-                "height": ctx.page.height,
-                "box_count": len(ctx.boxes),
-                "boxes": [
-                    {
-                        "label": box.label,
-                        "conf": round(box.conf, 4),
-                        "bbox": [round(v, 2) for v in box.as_tuple()],
-                    }
-                    for box in ctx.boxes
-                ],
-            }
-            for ctx in contexts
-        ],
+        "pages": [_page_trace(ctx) for ctx in contexts],
     }
     return contexts, input_trace, vision_trace
 
 
+def _page_trace(ctx: PageContext) -> Dict[str, object]:
+    # Round conf/bbox for the whole page in two vectorized calls on the SoA
+    # mirrors instead of per-box Python float formatting; the serializer
+    # only ever sees plain lists and floats.
+    confs = np.round(ctx.confs.astype(np.float64), 4).tolist()
+    bboxes = np.round(ctx.bboxes.astype(np.float64), 2).tolist()
+    return {
+        "index": ctx.page.index,
+        "width": ctx.page.width,
+        "height": ctx.page.height,
+        "box_count": len(ctx.boxes),
+        "boxes": [
+            {"label": label, "conf": conf, "bbox": bbox}
+            for label, conf, bbox in zip(ctx.labels, confs, bboxes)
+        ],
+    }
+
+
 def map_bbox_to_pdf_coords(bbox: Tuple[float, float, float, float], page: PageImage) -> Tuple[float, float, float, float]:
     scale = page.scale or 1.0
     if page.source == "image":
@@ -117,9 +150,25 @@ def build_report(
     )
 
 
+def write_json(payload: object, path: Path) -> None:
+    """Serialize a JSON artifact, via orjson when installed."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def append_jsonl(handle, event: object) -> None:
+    """Append one event to a binary JSONL handle, via orjson when installed."""
+    if orjson is not None:
+        handle.write(orjson.dumps(event) + b"\n")
+    else:
+        handle.write(json.dumps(event).encode("utf-8") + b"\n")
+
+
 def write_report(report: DecisionReport, path: Path) -> None:
     report.artifacts["report_json"] = str(path)
-    path.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+    write_json(report.to_dict(), path)
 
 
 def spans_to_payload(spans: Sequence[TextSpan]) -> List[Dict[str, object]]:
@@ -137,24 +186,70 @@ def spans_to_payload(spans: Sequence[TextSpan]) -> List[Dict[str, object]]:
     return payload
 
 
+def write_spans_ndjson(spans: Sequence[TextSpan], path: Path) -> None:
+    """Stream spans to disk as NDJSON, one record per line.
+
+    Avoids materializing the full payload list that write_json would need;
+    readers can iterate line by line instead of parsing one large document.
+    """
+    with open(path, "wb") as handle:
+        for span in spans:
+            append_jsonl(
+                handle,
+                {
+                    "text": span.text,
+                    "bbox": list(span.bbox),
+                    "page": span.page,
+                    "source": span.source,
+                    "ocr_conf": span.ocr_conf,
+                },
+            )
+
+
+def _pixmap_to_bgr(pix: fitz.Pixmap) -> np.ndarray:
+    array = np.frombuffer(pix.samples, dtype=np.uint8)
+    image = array.reshape(pix.height, pix.width, pix.n)
+    if pix.n == 4:
+        return cv2.cvtColor(image, cv2.COLOR_RGBA2BGR)
+    return cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_pdf_page_cached(pdf_path: str, mtime_ns: int, page_index: int, dpi: int) -> np.ndarray:
+    doc = fitz.open(pdf_path)
+    try:
+        mat = fitz.Matrix(dpi / 72.0, dpi / 72.0)
+        return _pixmap_to_bgr(doc[page_index].get_pixmap(matrix=mat))
+    finally:
+        doc.close()
+
+
 def render_pdf_to_image(pdf_path: Path, page_index: int, dpi: int = 350) -> np.ndarray:
+    # mtime in the key invalidates stale entries when an output PDF at the
+    # same path is rewritten between runs.
+    path = Path(pdf_path)
+    return _render_pdf_page_cached(str(path), path.stat().st_mtime_ns, page_index, dpi)
+
+
+def render_pdf_pages(
+    pdf_path: Path,
+    page_indices: Iterable[int],
+    dpi: int = 350,
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """Rasterize several pages of one PDF with a single document open."""
     doc = fitz.open(str(pdf_path))
     try:
-        page = doc[page_index]
         mat = fitz.Matrix(dpi / 72.0, dpi / 72.0)
-        pix = page.get_pixmap(matrix=mat)
-        mode = "RGB" if pix.n < 4 else "RGBA"
-        array = np.frombuffer(pix.samples, dtype=np.uint8)
-        image = array.reshape(pix.height, pix.width, pix.n)
-        if pix.n == 4:
-            image = cv2.cvtColor(image, cv2.COLOR_RGBA2BGR)
-        else:
-            image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-        return image
+        for page_index in page_indices:
+            yield page_index, _pixmap_to_bgr(doc[page_index].get_pixmap(matrix=mat))
     finally:
         doc.close()
 
 
+def clear_render_cache() -> None:
+    _render_pdf_page_cached.cache_clear()
+
+
 __all__ = [
     "ArtifactPaths",
     "PageContext",
@@ -162,7 +257,12 @@ __all__ = [
     "load_page_contexts",
     "map_bbox_to_pdf_coords",
     "build_report",
+    "append_jsonl",
+    "write_json",
     "write_report",
     "spans_to_payload",
+    "write_spans_ndjson",
     "render_pdf_to_image",
+    "render_pdf_pages",
+    "clear_render_cache",
 ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Protocol
 
 from n2n.packs.global_card_photo_v1 import run_pack as run_card_photo
@@ -11,11 +12,15 @@ from n2n.packs.global_pci_lite_v1 import run_pack as run_pci_lite
 class PackRunner(Protocol):
     def __call__(self, input_path: Path, outdir: Path, **kwargs) -> dict: ...
 
-_PACKS: Dict[str, PackRunner] = {
-    "global.pci_lite.v1": run_pci_lite,
-    "global.card_photo.v1": run_card_photo,
-    "global.id_photo.v1": run_id_photo,
-}
+# Read-only view: the pack table never changes after import, so freeze it
+# against accidental mutation by callers of list_packs/run_pack.
+_PACKS: "MappingProxyType[str, PackRunner]" = MappingProxyType(
+    {
+        "global.pci_lite.v1": run_pci_lite,
+        "global.card_photo.v1": run_card_photo,
+        "global.id_photo.v1": run_id_photo,
+    }
+)
 
 
 def list_packs() -> Dict[str, PackRunner]:
@@ -27,7 +32,12 @@ def run_pack(pack_id: str, input_path: str | Path, outdir: str | Path, **kwargs)
         runner = _PACKS[pack_id]
     except KeyError as exc:
         raise ValueError(f"Unknown pack: {pack_id}") from exc
-    return runner(Path(input_path), Path(outdir), **kwargs)
+    # Callers that already hold Path objects skip the re-construction.
+    if not isinstance(input_path, Path):
+        input_path = Path(input_path)
+    if not isinstance(outdir, Path):
+        outdir = Path(outdir)
+    return runner(input_path, outdir, **kwargs)
 
 
 __all__ = ["list_packs", "run_pack"]
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import functools
 import re
+import string
 from dataclasses import dataclass
 from typing import Dict, List, Sequence, Tuple
 
+import numpy as np
+
 from n2n.models import DetectionResult, TextSpan
 from n2n.primitives.registry import register_primitive
 
@@ -24,6 +28,37 @@ MASKED_MARKERS = {"*", "•"}
 _ALLOWED_PATTERN_CHARS = set("0123456789") | set(CONFUSABLE_MAP.keys())
 _ALLOWED_PATTERN_CLASS = "0-9" + "".join(sorted({re.escape(ch) for ch in CONFUSABLE_MAP.keys()}))
 PAN_RE = re.compile(rf"(?<![{_ALLOWED_PATTERN_CLASS}])(?:[{_ALLOWED_PATTERN_CLASS}][ \-]*){{13,19}}(?![{_ALLOWED_PATTERN_CLASS}])")
+# Compiled once alongside PAN_RE so the hot loops never hit re's pattern
+# cache lock on every sub call; used only as the non-ASCII fallback below.
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+_STITCH_STRIP_RE = re.compile(r"[^0-9A-Za-z%]")
+# Delete tables run the strip as a single C pass, but only cover latin-1;
+# _strip_non_digits/_strip_non_stitch fall back to the regex for the rare
+# candidate that is not pure ASCII.
+_DELETE_NON_DIGIT = str.maketrans(
+    "", "", "".join(chr(code) for code in range(256) if chr(code) not in string.digits)
+)
+_DELETE_NON_STITCH = str.maketrans(
+    "",
+    "",
+    "".join(
+        chr(code)
+        for code in range(256)
+        if chr(code) not in string.digits + string.ascii_letters + "%"
+    ),
+)
+
+
+def _strip_non_digits(text: str) -> str:
+    if text.isascii():
+        return text.translate(_DELETE_NON_DIGIT)
+    return _NON_DIGIT_RE.sub("", text)
+
+
+def _strip_non_stitch(text: str) -> str:
+    if text.isascii():
+        return text.translate(_DELETE_NON_STITCH)
+    return _STITCH_STRIP_RE.sub("", text)
 
 
 @dataclass
@@ -41,17 +76,61 @@ class CardPanConfig:
     min_token_conf_threshold: float = 0.6
 
 
+# Per-length Luhn row tables: position idx of a length-L candidate uses the
+# doubled row when idx % 2 == L % 2, the identity row otherwise. Baking the
+# parity decision into the table removes both branches from the digit loop.
+_LUHN_IDENTITY = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9)
+_LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+_LUHN_ROWS = {
+    length: tuple(
+        _LUHN_DOUBLED if idx % 2 == length % 2 else _LUHN_IDENTITY for idx in range(length)
+    )
+    for length in range(13, 20)
+}
+
+
 def _luhn(digits: str) -> bool:
-    total = 0
-    parity = len(digits) % 2
-    for idx, ch in enumerate(digits):
-        value = int(ch)
-        if idx % 2 == parity:
-            value *= 2
-            if value > 9:
-                value -= 9
-        total += value
-    return total % 10 == 0
+    rows = _LUHN_ROWS.get(len(digits))
+    if rows is None:
+        # Lengths outside the PAN range only reach here from defensive
+        # callers; fall back to the generic formulation.
+        total = 0
+        parity = len(digits) % 2
+        for idx, ch in enumerate(digits):
+            value = int(ch)
+            if idx % 2 == parity:
+                value *= 2
+                if value > 9:
+                    value -= 9
+            total += value
+        return total % 10 == 0
+    # Iterating the ascii bytes yields ints directly, so the loop indexes
+    # the row tables without an ord() call per digit.
+    return sum(row[b - 48] for row, b in zip(rows, digits.encode("ascii"))) % 10 == 0
+
+
+# Doubled-digit lookup for the vectorized Luhn: LUHN_DOUBLE[d] == 2*d with
+# the tens digit folded in (2*7=14 -> 5).
+_LUHN_DOUBLE = np.array([0, 2, 4, 6, 8, 1, 3, 5, 7, 9], dtype=np.uint8)
+
+
+def _luhn_batch(candidates: Sequence[str]) -> np.ndarray:
+    """Luhn-check many digit strings at once.
+
+    Candidates are packed into one left-aligned uint8 matrix; padding cells
+    hold 0 and contribute nothing to either branch of the sum. Returns a
+    boolean array in input order.
+    """
+    if not candidates:
+        return np.zeros(0, dtype=bool)
+    lengths = np.fromiter((len(c) for c in candidates), dtype=np.int64, count=len(candidates))
+    digits = np.zeros((len(candidates), int(lengths.max())), dtype=np.uint8)
+    for row, candidate in enumerate(candidates):
+        digits[row, : len(candidate)] = np.frombuffer(candidate.encode("ascii"), dtype=np.uint8) - ord("0")
+    cols = np.arange(digits.shape[1])
+    double_mask = (cols[None, :] % 2) == (lengths[:, None] % 2)
+    values = np.where(double_mask, _LUHN_DOUBLE[digits], digits)
+    return values.sum(axis=1) % 10 == 0
 
 
 def _mask(digits: str) -> str:
@@ -59,14 +138,76 @@ def _mask(digits: str) -> str:
     return " ".join(masked[i : i + 4] for i in range(0, len(masked), 4))
 
 
+# Byte classification for the span sanitizer: 1 = kept outright (digits,
+# space, hyphen), 2 = confusable kept only next to a digit, 0 = blanked.
+_SANITIZE_CLASS = np.zeros(256, dtype=np.uint8)
+for _ch in "0123456789 -":
+    _SANITIZE_CLASS[ord(_ch)] = 1
+for _ch in CONFUSABLE_MAP:
+    _SANITIZE_CLASS[ord(_ch)] = 2
+del _ch
+
+
+def _sanitize_span_text(raw_text: str) -> str:
+    """Blank everything but digits, separators and digit-adjacent confusables.
+
+    Runs as lookup-table classification plus shifted masks over the whole
+    span instead of a Python-level branch per character. Positions are
+    preserved, so match offsets still index into the raw text.
+    """
+    if not raw_text:
+        return ""
+    buf = np.frombuffer(raw_text.encode("latin-1", "replace"), dtype=np.uint8)
+    cls = _SANITIZE_CLASS[buf]
+    is_dig = (buf >= ord("0")) & (buf <= ord("9"))
+    prev_dig = np.empty_like(is_dig)
+    prev_dig[0] = False
+    prev_dig[1:] = is_dig[:-1]
+    next_dig = np.empty_like(is_dig)
+    next_dig[-1] = False
+    next_dig[:-1] = is_dig[1:]
+    keep = (cls == 1) | ((cls == 2) & (prev_dig | next_dig))
+    return np.where(keep, buf, ord(" ")).astype(np.uint8).tobytes().decode("latin-1")
+
+
 def _normalize_candidate(candidate: str, allow_confusable: bool) -> str:
     if any(marker in candidate for marker in MASKED_MARKERS):
         return ""
     cleaned = candidate
     if allow_confusable:
         cleaned = "".join(CONFUSABLE_MAP.get(ch, ch) for ch in cleaned)
-    digits = re.sub(r"[^0-9]", "", cleaned)
-    return digits
+    return _strip_non_digits(cleaned)
+
+
+@functools.lru_cache(maxsize=4096)
+def _single_span_candidates(
+    raw_text: str, allow_confusable: bool
+) -> Tuple[Tuple[str, bool], ...]:
+    """Sanitize, match, normalize and Luhn-check one span's text.
+
+    Pure function of the raw text, so results are memoized: headers and
+    boilerplate repeat verbatim across pages of a statement, and cache
+    hits skip the regex and Luhn work entirely. The severity decision
+    stays with the caller because it depends on span source/confidence.
+    """
+
+    sanitized_text = _sanitize_span_text(raw_text)
+    results: List[Tuple[str, bool]] = []
+    for match in PAN_RE.finditer(sanitized_text):
+        start, end = match.span()
+        while start < end and sanitized_text[start] not in _ALLOWED_PATTERN_CHARS:
+            start += 1
+        while end > start and sanitized_text[end - 1] not in _ALLOWED_PATTERN_CHARS:
+            end -= 1
+        if end <= start:
+            continue
+        normalized = _normalize_candidate(raw_text[start:end], allow_confusable)
+        if not 13 <= len(normalized) <= 19:
+            continue
+        if not normalized.isdigit():
+            continue
+        results.append((normalized, _luhn(normalized)))
+    return tuple(results)
 
 
 def find_card_pans(
@@ -89,38 +230,14 @@ def find_card_pans(
 
     for span in spans:
         raw_text = span.text or ""
-        chars = []
-        length = len(raw_text)
-        for idx, ch in enumerate(raw_text):
-            if ch.isdigit() or ch in " -":
-                chars.append(ch)
-                continue
-            if ch in CONFUSABLE_MAP:
-                prev_is_digit = idx > 0 and raw_text[idx - 1].isdigit()
-                next_is_digit = idx + 1 < length and raw_text[idx + 1].isdigit()
-                if prev_is_digit or next_is_digit:
-                    chars.append(ch)
-                    continue
-            chars.append(" ")
-        sanitized_text = "".join(chars)
-
-        for match in PAN_RE.finditer(sanitized_text):
-            start, end = match.span()
-            while start < end and sanitized_text[start] not in _ALLOWED_PATTERN_CHARS:
-                start += 1
-            while end > start and sanitized_text[end - 1] not in _ALLOWED_PATTERN_CHARS:
-                end -= 1
-            if end <= start:
-                continue
-            raw_candidate = raw_text[start:end]
-            normalized = _normalize_candidate(raw_candidate, cfg.allow_confusable_normalization)
-            if not 13 <= len(normalized) <= 19:
-                continue
-            if not normalized.isdigit():
-                continue
-
+        # A PAN needs at least 13 pattern characters, so shorter spans can
+        # never match; rejecting them here keeps the bulk of a page's small
+        # OCR tokens out of both the regex and the memo cache.
+        if len(raw_text) < 13:
+            continue
+        candidates = _single_span_candidates(raw_text, cfg.allow_confusable_normalization)
+        for normalized, passes_luhn in candidates:
             card_trace["single_span"]["candidates"] += 1
-            passes_luhn = _luhn(normalized)
             severity = "hit"
             validators = ["luhn"] if passes_luhn else []
 
@@ -180,121 +297,188 @@ def _stitch_ocr_spans(
     trace_entry.setdefault("suspicions", 0)
     trace_entry.setdefault("best_window", None)
 
+    # Phase one: enumerate and filter windows, deferring Luhn so all
+    # surviving candidates can be validated in one vectorized pass.
+    pending: List[Dict[str, object]] = []
     for page, page_spans in grouped.items():
         lines = _group_lines(page_spans, cfg.line_y_tol_px)
         for line in lines:
-            ordered = sorted(line, key=lambda s: s.bbox[0])
+            ordered = line  # already x-sorted by _group_lines
             length = len(ordered)
             if length < window_min:
                 continue
 
+            # Struct-of-arrays view of the line: the window loop below reads
+            # plain lists and prefix sums instead of dereferencing TextSpan
+            # attributes per (start, size), and the bbox/gap geometry is
+            # computed once for the whole line as NumPy columns.
+            texts = [span.text or "" for span in ordered]
+            span_digits = [
+                _normalize_stitched_candidate(text, cfg, allow_b_to_6=False) for text in texts
+            ]
+            prefix_len = [0]
+            for digits in span_digits:
+                prefix_len.append(prefix_len[-1] + len(digits))
+            bboxes = np.asarray([span.bbox for span in ordered], dtype=np.float32)
+            confs = [span.ocr_conf or 0.0 for span in ordered]
+            # Prefix counts of failures make the per-window digitish and gap
+            # checks O(1): a window is clean iff its failure count is zero.
+            not_digitish = [0]
+            for text in texts:
+                not_digitish.append(not_digitish[-1] + (not _is_digitish(text, cfg)))
+            gap_fail = [0]
+            if length > 1:
+                gap_fail.extend(np.cumsum(~_line_gaps_ok(bboxes, cfg)).tolist())
+
             max_window = min(window_max, length)
             for size in range(window_min, max_window + 1):
                 for start in range(0, length - size + 1):
-                    window = ordered[start : start + size]
-                    if not all(_is_digitish(span.text or "", cfg) for span in window):
+                    end = start + size
+                    if not_digitish[end] - not_digitish[start]:
                         continue
-                    if not _gaps_within_limits(window, cfg):
+                    if gap_fail[end - 1] - gap_fail[start]:
                         continue
-                    candidate_raw = " ".join(span.text or "" for span in window)
-                    digits_primary = _normalize_stitched_candidate(candidate_raw, cfg, allow_b_to_6=False)
-                    if not 13 <= len(digits_primary) <= 19:
+                    if not 13 <= prefix_len[end] - prefix_len[start] <= 19:
                         continue
                     trace_entry["windows_evaluated"] += 1
-                    avg_conf = _average_conf(window)
-                    min_conf = min(span.ocr_conf or 0.0 for span in window)
-                    passes_primary = _luhn(digits_primary)
-                    digits_used = digits_primary
-                    b6_used = False
-                    if (
-                        not passes_primary
-                        and cfg.allow_lowercase_b_to_6
-                        and any("b" in ((span.text or "").lower()) for span in window)
-                    ):
-                        digits_b6 = _normalize_stitched_candidate(candidate_raw, cfg, allow_b_to_6=True)
-                        if 13 <= len(digits_b6) <= 19 and _luhn(digits_b6):
-                            passes_primary = True
-                            digits_used = digits_b6
-                            b6_used = True
-                    low_conf = avg_conf < threshold or min_conf < cfg.min_token_conf_threshold
-                    validators = ["regex", "stitch"]
-                    severity = None
-                    reason = "luhn_fail_high_conf"
-                    if passes_primary:
-                        severity = "hit"
-                        validators.append("luhn")
-                        reason = "luhn_pass_b6" if b6_used else "luhn_pass"
-                        if b6_used:
-                            validators.append("confusable:b->6")
-                    elif low_conf:
-                        severity = "suspicion"
-                        validators.append("near_pan")
-                        reason = "luhn_fail_low_conf"
-
-                    info = _build_best_window_info(
-                        candidate_raw, digits_used, avg_conf, min_conf, passes_primary, reason
+                    window_confs = confs[start:end]
+                    pending.append(
+                        {
+                            "page": page,
+                            "bboxes": bboxes,
+                            "texts": texts,
+                            "start": start,
+                            "end": end,
+                            "candidate_raw": " ".join(texts[start:end]),
+                            "digits_primary": "".join(span_digits[start:end]),
+                            "avg_conf": sum(window_confs) / size,
+                            "min_conf": min(window_confs),
+                        }
                     )
-                    _update_best_window(trace_entry, info)
 
-                    if not severity:
-                        continue
+    if not pending:
+        return []
 
-                    bbox = _window_bbox(window)
-                    detection = DetectionResult(
-                        field_id="card_pan",
-                        text=_mask(digits_used),
-                        raw=candidate_raw.strip(),
-                        bbox=bbox,
-                        page=page,
-                        source="ocr",
-                        validators=validators,
-                        severity=severity,
-                    )
-                    key = (page, digits_used)
-                    meta = {
-                        "detection": detection,
-                        "avg_conf": avg_conf,
-                        "window_size": len(window),
-                        "x0": bbox[0],
-                        "severity": severity,
-                        "raw": candidate_raw.strip(),
-                        "normalized": digits_used,
-                        "min_conf": min_conf,
-                    }
-                    if severity == "hit":
-                        trace_entry["hits"] += 1
-                    else:
-                        trace_entry["suspicions"] += 1
-                    existing = candidates.get(key)
-                    if not existing or _is_better_candidate(meta, existing):
-                        candidates[key] = meta
+    passes = _luhn_batch([entry["digits_primary"] for entry in pending])
+    # Second, much smaller batch for the b->6 retries of primary failures.
+    b6_digits: Dict[int, str] = {}
+    if cfg.allow_lowercase_b_to_6:
+        for idx, entry in enumerate(pending):
+            if passes[idx]:
+                continue
+            window_texts = entry["texts"][entry["start"] : entry["end"]]
+            if not any("b" in text.lower() for text in window_texts):
+                continue
+            digits_b6 = _normalize_stitched_candidate(entry["candidate_raw"], cfg, allow_b_to_6=True)
+            if 13 <= len(digits_b6) <= 19:
+                b6_digits[idx] = digits_b6
+        if b6_digits:
+            b6_pass = _luhn_batch(list(b6_digits.values()))
+            b6_digits = {
+                idx: digits for (idx, digits), ok in zip(b6_digits.items(), b6_pass) if ok
+            }
+
+    for idx, entry in enumerate(pending):
+        page = entry["page"]
+        start, end = entry["start"], entry["end"]
+        candidate_raw = entry["candidate_raw"]
+        avg_conf = entry["avg_conf"]
+        min_conf = entry["min_conf"]
+        passes_primary = bool(passes[idx])
+        digits_used = entry["digits_primary"]
+        b6_used = False
+        if not passes_primary and idx in b6_digits:
+            passes_primary = True
+            digits_used = b6_digits[idx]
+            b6_used = True
+        low_conf = avg_conf < threshold or min_conf < cfg.min_token_conf_threshold
+        validators = ["regex", "stitch"]
+        severity = None
+        reason = "luhn_fail_high_conf"
+        if passes_primary:
+            severity = "hit"
+            validators.append("luhn")
+            reason = "luhn_pass_b6" if b6_used else "luhn_pass"
+            if b6_used:
+                validators.append("confusable:b->6")
+        elif low_conf:
+            severity = "suspicion"
+            validators.append("near_pan")
+            reason = "luhn_fail_low_conf"
+
+        info = _build_best_window_info(
+            candidate_raw, digits_used, avg_conf, min_conf, passes_primary, reason
+        )
+        _update_best_window(trace_entry, info)
+
+        if not severity:
+            continue
+
+        bbox = _window_bbox(entry["bboxes"][start:end])
+        detection = DetectionResult(
+            field_id="card_pan",
+            text=_mask(digits_used),
+            raw=candidate_raw.strip(),
+            bbox=bbox,
+            page=page,
+            source="ocr",
+            validators=validators,
+            severity=severity,
+        )
+        key = (page, digits_used)
+        meta = {
+            "detection": detection,
+            "avg_conf": avg_conf,
+            "window_size": end - start,
+            "x0": bbox[0],
+            "severity": severity,
+            "raw": candidate_raw.strip(),
+            "normalized": digits_used,
+            "min_conf": min_conf,
+        }
+        if severity == "hit":
+            trace_entry["hits"] += 1
+        else:
+            trace_entry["suspicions"] += 1
+        existing = candidates.get(key)
+        if not existing or _is_better_candidate(meta, existing):
+            candidates[key] = meta
 
     return [entry["detection"] for entry in candidates.values()]
 
 
 def _group_lines(spans: List[TextSpan], tolerance: float) -> List[List[TextSpan]]:
-    sorted_spans = sorted(spans, key=lambda s: (_y_center(s.bbox), s.bbox[0]))
+    # Bucket spans by quantized y-center instead of sorting the whole page:
+    # the O(n log n) Timsort over every span becomes an O(n) bucketing pass
+    # plus a sort over the (much smaller) set of occupied buckets. Adjacent
+    # buckets whose mean centers sit within the tolerance are coalesced so
+    # lines straddling a bucket boundary still group together.
+    tolerance = max(tolerance, 1e-6)
+    buckets: Dict[int, List[TextSpan]] = {}
+    for span in spans:
+        buckets.setdefault(int(_y_center(span.bbox) / tolerance), []).append(span)
+
     lines: List[List[TextSpan]] = []
     current: List[TextSpan] = []
-    current_center: float | None = None
-
-    for span in sorted_spans:
-        center = _y_center(span.bbox)
-        if not current:
-            current = [span]
-            current_center = center
-            continue
-        if abs(center - (current_center or center)) <= tolerance:
-            current.append(span)
-            # Update running center
-            current_center = (current_center * (len(current) - 1) + center) / len(current)
+    current_center = 0.0
+    for key in sorted(buckets):
+        bucket = buckets[key]
+        center = sum(_y_center(span.bbox) for span in bucket) / len(bucket)
+        if current and abs(center - current_center) <= tolerance:
+            current_center = (current_center * len(current) + center * len(bucket)) / (
+                len(current) + len(bucket)
+            )
+            current.extend(bucket)
         else:
-            lines.append(current)
-            current = [span]
+            if current:
+                lines.append(current)
+            current = bucket
             current_center = center
-
     if current:
         lines.append(current)
+
+    for line in lines:
+        line.sort(key=lambda s: s.bbox[0])
     return lines
 
 
@@ -319,32 +503,38 @@ def _is_digitish(text: str, cfg: CardPanConfig) -> bool:
     return ratio >= cfg.digitish_ratio
 
 
-def _gaps_within_limits(window: Sequence[TextSpan], cfg: CardPanConfig) -> bool:
-    for left, right in zip(window, window[1:]):
-        left_x2 = left.bbox[2]
-        right_x1 = right.bbox[0]
-        gap = right_x1 - left_x2
-        if gap <= 0:
-            continue
-        left_h = max(0.0, left.bbox[3] - left.bbox[1])
-        right_h = max(0.0, right.bbox[3] - right.bbox[1])
-        avg_h = (left_h + right_h) / 2 or 1.0
-        if gap > cfg.max_x_gap_px and gap > cfg.max_x_gap_ratio * avg_h:
-            return False
-    return True
+def _line_gaps_ok(bboxes: "np.ndarray", cfg: CardPanConfig) -> "np.ndarray":
+    # Pairwise x-gap admissibility for one line, computed as column maths
+    # over the (n, 4) bbox array: gap i sits between spans i and i + 1.
+    gaps = bboxes[1:, 0] - bboxes[:-1, 2]
+    heights = np.maximum(bboxes[:, 3] - bboxes[:, 1], 0.0)
+    avg_h = (heights[:-1] + heights[1:]) / 2.0
+    avg_h = np.where(avg_h == 0.0, 1.0, avg_h)
+    return (gaps <= 0) | (gaps <= cfg.max_x_gap_px) | (gaps <= cfg.max_x_gap_ratio * avg_h)
+
+
+# Translation tables for the stitched normalization, keyed on the two cfg
+# bits that change the mapping. Letters that stay letters map to None so
+# translate drops them; digits fall through untouched.
+_STITCH_TABLES: Dict[Tuple[bool, bool], Dict[int, str | None]] = {}
+
+
+def _stitch_table(cfg: CardPanConfig, allow_b_to_6: bool) -> Dict[int, str | None]:
+    key = (cfg.allow_symbol_confusables, bool(allow_b_to_6 and cfg.allow_lowercase_b_to_6))
+    table = _STITCH_TABLES.get(key)
+    if table is None:
+        table = {}
+        for ch in string.ascii_letters + "%":
+            mapped = _map_stitch_char(ch, cfg, allow_b_to_6)
+            table[ord(ch)] = mapped if mapped.isdigit() else None
+        _STITCH_TABLES[key] = table
+    return table
 
 
 def _normalize_stitched_candidate(candidate_raw: str, cfg: CardPanConfig, allow_b_to_6: bool) -> str:
-    cleaned = re.sub(r"[^0-9A-Za-z%]", "", candidate_raw or "")
-    mapped_chars: List[str] = []
-    for ch in cleaned:
-        if ch.isdigit():
-            mapped_chars.append(ch)
-            continue
-        mapped = _map_stitch_char(ch, cfg, allow_b_to_6)
-        if mapped.isdigit():
-            mapped_chars.append(mapped)
-    return "".join(mapped_chars)
+    cleaned = _strip_non_stitch(candidate_raw or "")
+    # str.translate runs the whole per-character map/drop loop in C.
+    return cleaned.translate(_stitch_table(cfg, allow_b_to_6))
 
 
 def _map_stitch_char(ch: str, cfg: CardPanConfig, allow_b_to_6: bool) -> str:
@@ -367,17 +557,10 @@ def _map_stitch_char(ch: str, cfg: CardPanConfig, allow_b_to_6: bool) -> str:
     return ch
 
 
-def _average_conf(window: Sequence[TextSpan]) -> float:
-    confidences = [span.ocr_conf or 0.0 for span in window]
-    return sum(confidences) / len(confidences)
-
-
-def _window_bbox(window: Sequence[TextSpan]) -> Tuple[float, float, float, float]:
-    x0 = min(span.bbox[0] for span in window)
-    y0 = min(span.bbox[1] for span in window)
-    x1 = max(span.bbox[2] for span in window)
-    y1 = max(span.bbox[3] for span in window)
-    return (x0, y0, x1, y1)
+def _window_bbox(bboxes: "np.ndarray") -> Tuple[float, float, float, float]:
+    mins = bboxes.min(axis=0)
+    maxs = bboxes.max(axis=0)
+    return (float(mins[0]), float(mins[1]), float(maxs[2]), float(maxs[3]))
 
 
 def _y_center(bbox: Tuple[float, float, float, float]) -> float:
@@ -436,7 +619,7 @@ def find_pan_candidates_from_roi_text(
     if match:
         candidates.append(cleaned[match.start() : match.end()])
     else:
-        digits = re.sub(r"[^0-9]", "", cleaned)
+        digits = _strip_non_digits(cleaned)
         if 13 <= len(digits) <= 19:
             candidates.append(digits)
     detections: List[DetectionResult] = []
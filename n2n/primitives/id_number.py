@@ -9,7 +9,9 @@ ID_RE = re.compile(r"[A-Z0-9]{6,}")
 
 
 def detect_id_number(text: str) -> str | None:
-    if not text:
+    # A candidate needs at least 6 alphanumerics; skip the regex for
+    # obviously-too-short OCR fragments.
+    if not text or len(text) < 6:
         return None
     match = ID_RE.search(text.replace(" ", ""))
     if not match:
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Sequence, Tuple
+from typing import Iterator, List, Sequence, Tuple
 
 import fitz
+import numpy as np
 from PIL import Image
 
 
@@ -17,9 +18,55 @@ class RenderBox:
     page_scale: float = 1.0
 
 
+@dataclass
+class RenderBoxBatch:
+    """Structure-of-arrays form of a RenderBox sequence.
+
+    Holds the numeric fields as contiguous numpy arrays so callers with many
+    boxes avoid per-box dataclass allocation in the render loops.
+    """
+
+    bboxes: np.ndarray  # (N, 4) float32
+    pages: np.ndarray  # (N,) int32
+    labels: List[str]
+    colors: np.ndarray  # (N, 3) float32
+    page_scales: np.ndarray  # (N,) float32
+
+    @classmethod
+    def from_boxes(cls, boxes: Sequence[RenderBox]) -> "RenderBoxBatch":
+        return cls(
+            bboxes=np.array([box.bbox for box in boxes], dtype=np.float32).reshape(-1, 4),
+            pages=np.array([box.page for box in boxes], dtype=np.int32),
+            labels=[box.label for box in boxes],
+            colors=np.array([box.color for box in boxes], dtype=np.float32).reshape(-1, 3),
+            page_scales=np.array([box.page_scale or 1.0 for box in boxes], dtype=np.float32),
+        )
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+
+_RenderRow = Tuple[int, Tuple[float, float, float, float], str, Tuple[float, float, float], float]
+
+
+def _iter_render_rows(boxes: Sequence[RenderBox] | RenderBoxBatch) -> Iterator[_RenderRow]:
+    if isinstance(boxes, RenderBoxBatch):
+        for idx in range(len(boxes)):
+            yield (
+                int(boxes.pages[idx]),
+                tuple(float(v) for v in boxes.bboxes[idx]),
+                boxes.labels[idx],
+                tuple(float(v) for v in boxes.colors[idx]),
+                float(boxes.page_scales[idx]),
+            )
+        return
+    for box in boxes:
+        yield box.page, box.bbox, box.label, box.color, box.page_scale
+
+
 def render_highlight_from_boxes(
     input_path: str | Path,
-    boxes: Sequence[RenderBox] | None,
+    boxes: Sequence[RenderBox] | RenderBoxBatch | None,
     out_pdf: str | Path,
 ) -> str:
     doc, created = _load_document(Path(input_path))
@@ -34,7 +81,7 @@ def render_highlight_from_boxes(
 
 def render_redact_from_boxes(
     input_path: str | Path,
-    boxes: Sequence[RenderBox] | None,
+    boxes: Sequence[RenderBox] | RenderBoxBatch | None,
     out_pdf: str | Path,
 ) -> str:
     doc, created = _load_document(Path(input_path))
@@ -47,36 +94,40 @@ def render_redact_from_boxes(
     return str(out_pdf)
 
 
-def _draw_highlights(doc: fitz.Document, boxes: Sequence[RenderBox]) -> None:
-    for box in boxes:
-        if box.page < 0 or box.page >= len(doc):
+def _draw_highlights(doc: fitz.Document, boxes: Sequence[RenderBox] | RenderBoxBatch) -> None:
+    for page_idx, bbox, label, color, page_scale in _iter_render_rows(boxes):
+        if page_idx < 0 or page_idx >= len(doc):
             continue
-        rect = _resolve_rect(doc, box)
-        page = doc[box.page]
+        rect = _resolve_rect(doc, bbox, page_scale)
+        page = doc[page_idx]
         shape = page.new_shape()
         shape.draw_rect(rect)
-        shape.finish(color=box.color, width=2.0)
-        if box.label:
-            page.insert_textbox(rect, box.label, fontsize=8, color=box.color, overlay=True)
+        shape.finish(color=color, width=2.0)
+        if label:
+            page.insert_textbox(rect, label, fontsize=8, color=color, overlay=True)
 
 
-def _apply_redactions(doc: fitz.Document, boxes: Sequence[RenderBox]) -> None:
-    for box in boxes:
-        if box.page < 0 or box.page >= len(doc):
+def _apply_redactions(doc: fitz.Document, boxes: Sequence[RenderBox] | RenderBoxBatch) -> None:
+    for page_idx, bbox, _, _, page_scale in _iter_render_rows(boxes):
+        if page_idx < 0 or page_idx >= len(doc):
             continue
-        rect = _resolve_rect(doc, box)
-        page = doc[box.page]
+        rect = _resolve_rect(doc, bbox, page_scale)
+        page = doc[page_idx]
         shape = page.new_shape()
         shape.draw_rect(rect)
         shape.finish(color=None, fill=(0.0, 0.0, 0.0))
 
 
-def _resolve_rect(doc: fitz.Document, box: RenderBox) -> fitz.Rect:
+def _resolve_rect(
+    doc: fitz.Document,
+    bbox: Tuple[float, float, float, float],
+    page_scale: float,
+) -> fitz.Rect:
     if doc.is_pdf:
-        scale = box.page_scale or 1.0
-        coords = [coord / scale for coord in box.bbox]
+        scale = page_scale or 1.0
+        coords = [coord / scale for coord in bbox]
     else:
-        coords = box.bbox
+        coords = bbox
     return fitz.Rect(*coords)
 
 
@@ -91,4 +142,4 @@ def _load_document(path: Path) -> tuple[fitz.Document, bool]:
     return doc, True
 
 
-__all__ = ["RenderBox", "render_highlight_from_boxes", "render_redact_from_boxes"]
+__all__ = ["RenderBox", "RenderBoxBatch", "render_highlight_from_boxes", "render_redact_from_boxes"]
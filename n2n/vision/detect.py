@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List
@@ -26,19 +27,75 @@ def load_yolo_model(weights_path: str | Path) -> tuple[object | None, dict[str,
     if YOLO is None:
         info["reason"] = "ultralytics_unavailable"
         return None, info
-    key = str(path.resolve())
+
+    # A sibling TensorRT engine, when present, replaces the .pt weights:
+    # the engine runs the same network through tensor cores at a fraction
+    # of the latency. Setting N2N_YOLO_TRT=1 exports one on first load;
+    # export failure (no GPU, no tensorrt install) falls back to .pt.
+    engine_path = path.with_suffix(".engine")
+    if not engine_path.exists() and os.environ.get("N2N_YOLO_TRT"):
+        try:
+            YOLO(str(path)).export(
+                format="engine",
+                half=True,
+                device=0,
+                dynamic=False,
+                batch=int(os.environ.get("N2N_YOLO_BATCH", "16")),
+            )
+        except Exception:
+            pass
+    load_path = engine_path if engine_path.exists() else path
+
+    key = str(load_path.resolve())
     model = _MODEL_CACHE.get(key)
     if model is not None:
         info["reason"] = "cached"
         info["model_used"] = True
         return model, info
-    model = YOLO(str(path))
+    model = YOLO(str(load_path))
+    if hasattr(model, "eval"):
+        model.eval()
     _MODEL_CACHE[key] = model
-    info["reason"] = "loaded"
+    info["reason"] = "loaded_engine" if load_path is engine_path else "loaded"
     info["model_used"] = True
     return model, info
 
 
+def clear_model_cache() -> None:
+    """Drop cached YOLO models, e.g. to free memory in long-running servers."""
+    _MODEL_CACHE.clear()
+
+
+def _boxes_from_result(result: object, names: dict, page_idx: int) -> List[Box]:
+    boxes: List[Box] = []
+    r_boxes = getattr(result, "boxes", None)
+    if r_boxes is None:
+        return boxes
+    xyxy = r_boxes.xyxy.cpu().numpy() if hasattr(r_boxes.xyxy, "cpu") else r_boxes.xyxy
+    confs = r_boxes.conf.cpu().numpy() if hasattr(r_boxes.conf, "cpu") else r_boxes.conf
+    cls_indices = r_boxes.cls.cpu().numpy() if hasattr(r_boxes.cls, "cpu") else r_boxes.cls
+
+    # One tolist() per array converts everything to Python scalars in C,
+    # instead of boxing float()/int() element by element in the loop.
+    count = len(xyxy)
+    coords_list = xyxy.tolist() if hasattr(xyxy, "tolist") else [list(map(float, c)) for c in xyxy]
+    if confs is None:
+        confs_list = [0.0] * count
+    else:
+        confs_list = confs.tolist() if hasattr(confs, "tolist") else [float(c) for c in confs]
+    if cls_indices is None:
+        cls_list = [0] * count
+    elif hasattr(cls_indices, "astype"):
+        cls_list = cls_indices.astype(int).tolist()
+    else:
+        cls_list = [int(c) for c in cls_indices]
+
+    for (x1, y1, x2, y2), conf, cls_idx in zip(coords_list, confs_list, cls_list):
+        label = names.get(cls_idx, str(cls_idx))
+        boxes.append(Box(label=label, conf=conf, page=page_idx, x1=x1, y1=y1, x2=x2, y2=y2))
+    return boxes
+
+
 def detect_objects(image: np.ndarray, model: object | None, conf_threshold: float = 0.25) -> List[Box]:
     if model is None or image is None:
         return []
@@ -48,19 +105,44 @@ def detect_objects(image: np.ndarray, model: object | None, conf_threshold: floa
         return boxes
     names = getattr(results[0], "names", {}) or getattr(model, "names", {}) or {}
     for page_idx, result in enumerate(results):
-        r_boxes = getattr(result, "boxes", None)
-        if r_boxes is None:
-            continue
-        xyxy = r_boxes.xyxy.cpu().numpy() if hasattr(r_boxes.xyxy, "cpu") else r_boxes.xyxy
-        confs = r_boxes.conf.cpu().numpy() if hasattr(r_boxes.conf, "cpu") else r_boxes.conf
-        cls_indices = r_boxes.cls.cpu().numpy() if hasattr(r_boxes.cls, "cpu") else r_boxes.cls
-        for idx, coords in enumerate(xyxy):
-            x1, y1, x2, y2 = map(float, coords)
-            cls_idx = int(cls_indices[idx]) if cls_indices is not None else 0
-            label = names.get(cls_idx, str(cls_idx))
-            conf = float(confs[idx]) if confs is not None else 0.0
-            boxes.append(Box(label=label, conf=conf, page=page_idx, x1=x1, y1=y1, x2=x2, y2=y2))
+        boxes.extend(_boxes_from_result(result, names, page_idx))
     return boxes
 
 
-__all__ = ["load_yolo_model", "detect_objects"]
+def detect_objects_batch(
+    images: Iterable[np.ndarray],
+    model: object | None,
+    conf_threshold: float = 0.25,
+    batch_size: int = 16,
+) -> List[List[Box]]:
+    """Run detection over many images in a few model calls.
+
+    Ultralytics batches a list source internally, so this pays Python->torch
+    dispatch once per chunk instead of per page. Chunks of ``batch_size``
+    bound peak memory on long documents — GPU utilisation saturates around
+    that size, so larger batches only add buffering. Returns one box list
+    per input image, in order.
+    """
+    images = list(images)
+    if model is None or not images:
+        return [[] for _ in images]
+
+    batch_size = max(1, batch_size)
+    per_image: List[List[Box]] = []
+    names: dict = {}
+    for start in range(0, len(images), batch_size):
+        chunk = images[start : start + batch_size]
+        results = model(chunk, verbose=False, conf=conf_threshold) or []
+        if results and not names:
+            names = getattr(results[0], "names", {}) or getattr(model, "names", {}) or {}
+        for result in results:
+            per_image.append(_boxes_from_result(result, names, 0))
+        # Defensive: keep output aligned with input even if the model
+        # drops frames within a chunk.
+        expected = min(start + batch_size, len(images))
+        while len(per_image) < expected:
+            per_image.append([])
+    return per_image
+
+
+__all__ = ["load_yolo_model", "clear_model_cache", "detect_objects", "detect_objects_batch"]
@@ -1,5 +1,9 @@
 import pathlib
 import sys
+from typing import Dict, Tuple
+
+import numpy as np
+import pytest
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 root_str = str(ROOT)
@@ -17,3 +21,60 @@ def pytest_sessionstart(session):
             "Run: pip uninstall -y n2n-redactor && pip install -e ."
         )
 
+
+# The photo pack tests build zeroed page/ROI images on every call; the
+# pipelines under test only read them (OCR and rendering are mocked), so
+# one buffer per shape can be shared across the session. Buffers are
+# handed out read-only so an accidental in-place write fails loudly
+# instead of leaking state between tests.
+_ZERO_IMAGES: Dict[Tuple[int, ...], np.ndarray] = {}
+
+
+# Most pack tests only need an input path that exists on disk — the
+# mocked pipelines never read it — so one sentinel file per flavour
+# serves the whole session instead of a write per test.
+@pytest.fixture(scope="session")
+def sentinel_img(tmp_path_factory):
+    path = tmp_path_factory.mktemp("sentinel") / "img.jpg"
+    path.write_bytes(b"img")
+    return path
+
+
+@pytest.fixture(scope="session")
+def sentinel_pdf(tmp_path_factory):
+    path = tmp_path_factory.mktemp("sentinel") / "input.pdf"
+    path.write_bytes(b"dummy")
+    return path
+
+
+@pytest.fixture
+def install_pack_mocks(request):
+    """Install several pack-module overrides in one dict update.
+
+    The photo pack tests patch five to seven module attributes per test;
+    doing that through individual monkeypatch.setattr calls pays backup
+    and teardown registration per name. This snapshots the originals
+    once, applies all overrides in a single vars() update, and restores
+    from the one snapshot at teardown.
+    """
+
+    def _install(pack_module, **overrides):
+        snapshot = {name: getattr(pack_module, name) for name in overrides}
+        vars(pack_module).update(overrides)
+        request.addfinalizer(lambda: vars(pack_module).update(snapshot))
+
+    return _install
+
+
+@pytest.fixture(scope="session")
+def zero_image():
+    def _get(shape: Tuple[int, ...]) -> np.ndarray:
+        buf = _ZERO_IMAGES.get(shape)
+        if buf is None:
+            buf = np.zeros(shape, dtype=np.uint8)
+            buf.flags.writeable = False
+            _ZERO_IMAGES[shape] = buf
+        return buf
+
+    return _get
+
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import fitz
+import pytest
 
 from n2n.models import DetectionResult, TextSpan
 from n2n.packs import global_pci_lite_v1 as pack
@@ -29,18 +30,22 @@ def _patch_render(monkeypatch, tmp_path):
 
 
 def _extract_result(spans, used_ocr=False):
+    text_count = ocr_count = 0
+    for span in spans:
+        source = (span.source or "").lower()
+        text_count += source == "text"
+        ocr_count += source == "ocr"
     stats = {
         "used_ocr": used_ocr,
         "span_count": len(spans),
-        "text_span_count": sum(1 for s in spans if (s.source or "") == "text"),
-        "ocr_span_count": sum(1 for s in spans if (s.source or "").lower() == "ocr"),
+        "text_span_count": text_count,
+        "ocr_span_count": ocr_count,
     }
     return (spans, {}, stats)
 
 
-def test_suspicion_triggers_review(tmp_path, monkeypatch):
-    pdf = tmp_path / "suspicion.pdf"
-    pdf.write_text("dummy")
+def test_suspicion_triggers_review(tmp_path, monkeypatch, sentinel_pdf):
+    pdf = sentinel_pdf
 
     monkeypatch.setattr(pack, "MIN_CHAR_COUNT", 0)
     monkeypatch.setattr(
@@ -60,9 +65,8 @@ def test_suspicion_triggers_review(tmp_path, monkeypatch):
     assert "card_pan" in report["trace"]
 
 
-def test_hits_confirmed_when_redaction_clean(tmp_path, monkeypatch):
-    pdf = tmp_path / "confirm.pdf"
-    pdf.write_text("dummy")
+def test_hits_confirmed_when_redaction_clean(tmp_path, monkeypatch, sentinel_pdf):
+    pdf = sentinel_pdf
 
     monkeypatch.setattr(pack, "MIN_CHAR_COUNT", 0)
     call_state = {"count": 0}
@@ -87,9 +91,8 @@ def test_hits_confirmed_when_redaction_clean(tmp_path, monkeypatch):
     assert report["trace"]["post_redaction"]["hits_remaining"] == 0
 
 
-def test_remaining_hits_after_redaction_review(tmp_path, monkeypatch):
-    pdf = tmp_path / "review.pdf"
-    pdf.write_text("dummy")
+def test_remaining_hits_after_redaction_review(tmp_path, monkeypatch, sentinel_pdf):
+    pdf = sentinel_pdf
 
     monkeypatch.setattr(pack, "MIN_CHAR_COUNT", 0)
     call_state = {"count": 0}
@@ -108,17 +111,21 @@ def test_remaining_hits_after_redaction_review(tmp_path, monkeypatch):
     assert report["trace"]["post_redaction"]["hits_remaining"] >= 1
 
 
-def _create_pdf(path: Path, text: str):
+@pytest.fixture(scope="module")
+def pdf_template_bytes() -> bytes:
+    # Built once per module: fitz.open() pays MuPDF context setup, which
+    # dwarfs the cost of writing the cached bytes into each tmp path.
     doc = fitz.open()
     page = doc.new_page()
-    page.insert_text((72, 720), text, fontsize=14)
-    doc.save(path)
+    page.insert_text((72, 720), "Card 4111 1111 1111 1111 for testing.", fontsize=14)
+    data = doc.tobytes()
     doc.close()
+    return data
 
 
-def test_full_pack_generates_artifacts(tmp_path):
+def test_full_pack_generates_artifacts(tmp_path, pdf_template_bytes):
     pdf_path = tmp_path / "integration.pdf"
-    _create_pdf(pdf_path, "Card 4111 1111 1111 1111 for testing.")
+    pdf_path.write_bytes(pdf_template_bytes)
 
     report = pack.run_pack(pdf_path, tmp_path)
 